@@ -0,0 +1,117 @@
+import argparse
+import contextlib
+import io
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+from bench import measure
+from cache import input_digest
+from days import PYTHON_DIR, Day, select
+import gen
+import memprofile
+
+DEFAULT_PATH = PYTHON_DIR.parent / "baseline.json"
+
+# Regressions are flagged when a day gets this much slower or bigger.
+DEFAULT_THRESHOLD = 0.2
+
+Baseline = dict[str, dict[str, Any]]
+
+
+def collect(
+    patterns: list[str],
+    sizes: list[int] | None,
+    seed: int,
+    warmup: int,
+    repeat: int,
+) -> Baseline:
+    baseline = {}
+    for name in select(patterns):
+        if sizes is not None and gen.find(name) is None:
+            print(f"skipping {name}, it has no input generator", file=sys.stderr)
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            day = Day.load(name)
+        if sizes is None:
+            runs = [(name, day.read_input())]
+        else:
+            runs = [(f"{name}@{size}", gen.generate(name, size, seed)) for size in sizes]
+        for (key, input) in runs:
+            print(f"measuring {key}", file=sys.stderr)
+            with contextlib.redirect_stdout(io.StringIO()):
+                entry = measure(day, input, warmup, repeat)
+                peak = memprofile.peak(lambda: day.solve(input))
+            baseline[key] = {
+                "median": entry["wall"]["median"],
+                "peak_bytes": peak,
+                "input": input_digest(input),
+            }
+    return baseline
+
+
+def change(old: float, new: float) -> float:
+    return new / old - 1 if old > 0 else 0.0
+
+
+def compare(old: Baseline, new: Baseline, threshold: float) -> list[str]:
+    regressions = []
+    print(f"{'day':14} {'time':>10} {'was':>10} {'change':>8} {'memory':>12} {'was':>12} {'change':>8}")
+    for (key, entry) in new.items():
+        if key not in old:
+            print(f"{key:14} {entry['median']:10.4f} {'':>10} {'':>8} {entry['peak_bytes']:12} {'':>12} {'':>8}  new")
+            continue
+        base = old[key]
+        time_change = change(base["median"], entry["median"])
+        memory_change = change(base["peak_bytes"], entry["peak_bytes"])
+        notes = []
+        if base["input"] != entry["input"]:
+            notes.append("input changed")
+        elif time_change > threshold or memory_change > threshold:
+            notes.append("REGRESSION")
+            regressions.append(key)
+        print(
+            f"{key:14} {entry['median']:10.4f} {base['median']:10.4f} {time_change:+8.1%}"
+            f" {entry['peak_bytes']:12} {base['peak_bytes']:12} {memory_change:+8.1%}"
+            + "".join(f"  {note}" for note in notes)
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record performance baselines of the day modules or compare against them.",
+    )
+    parser.add_argument("command", choices=["record", "compare"])
+    parser.add_argument("modules", nargs="*", help="module names or prefixes, e.g. day01 or day14b2")
+    parser.add_argument("--file", type=Path, default=DEFAULT_PATH, help="baseline file to write or compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown that counts as a regression")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--sizes",
+        type=lambda sizes: [int(size) for size in sizes.split(",")],
+        help="use synthetic inputs of these comma separated sizes instead of the real inputs",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if args.command == "compare" and not args.file.exists():
+        parser.error(f"there is no baseline at {args.file}, record one first")
+    baseline = collect(args.modules, args.sizes, args.seed, args.warmup, args.repeat)
+    if args.command == "record":
+        if args.file.exists():
+            # Recording a subset of the days keeps the others' entries.
+            baseline = {**json.loads(args.file.read_text()), **baseline}
+        args.file.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return
+    regressions = compare(json.loads(args.file.read_text()), baseline, args.threshold)
+    if regressions:
+        sys.exit(f"{len(regressions)} regressions beyond {args.threshold:.0%}: {' '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import json
+import math
+import os
+from pathlib import Path
+import signal
+import sys
+import time
+from typing import Any
+
+from days import Day
+
+DAY: Day | None = None
+TIMEOUT: float | None = None
+
+
+class Timeout(Exception):
+    pass
+
+
+def raise_timeout(signum, frame):
+    raise Timeout()
+
+
+def init_worker(name: str, timeout: float | None) -> None:
+    # Each worker imports the day once and reuses it for all of its inputs.
+    global DAY, TIMEOUT
+    sys.stdout = open(os.devnull, "w")
+    DAY = Day.load(name)
+    TIMEOUT = timeout
+    signal.signal(signal.SIGALRM, raise_timeout)
+
+
+def solve_file(path: Path) -> dict[str, Any]:
+    entry: dict[str, Any] = {"input": path.name}
+    start = time.perf_counter()
+    try:
+        input = path.read_text()
+        if TIMEOUT is not None:
+            signal.setitimer(signal.ITIMER_REAL, TIMEOUT)
+        try:
+            entry["result"] = DAY.solve(input)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except Timeout:
+        entry["error"] = f"timed out after {TIMEOUT} s"
+    except Exception as error:
+        entry["error"] = f"{type(error).__name__}: {error}"
+    entry["seconds"] = time.perf_counter() - start
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve a day on every input file of a directory using a pool of worker processes.",
+    )
+    parser.add_argument("module", help="module name, e.g. day19a")
+    parser.add_argument("directory", type=Path, help="directory with one input file per puzzle")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--timeout", type=float, help="give up on an input after this many seconds")
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="inputs handed to a worker at once, by default spread evenly over the workers",
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    with contextlib.redirect_stdout(sys.stderr):
+        day = Day.load(args.module)
+    if hasattr(day.module, "INPUT"):
+        parser.error(f"{day.name} takes its input as Python values, not as a file")
+    paths = sorted(path for path in args.directory.iterdir() if path.is_file())
+    chunksize = args.chunksize or max(math.ceil(len(paths) / (4 * args.workers)), 1)
+
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=init_worker,
+        initargs=(day.name, args.timeout),
+    ) as executor:
+        # map yields the entries in input order as soon as each one is done.
+        for entry in executor.map(solve_file, paths, chunksize=chunksize):
+            failed += "error" in entry
+            print(json.dumps(entry, default=str), flush=True)
+    if failed:
+        sys.exit(f"{failed} of {len(paths)} inputs failed")
+
+
+if __name__ == "__main__":
+    main()
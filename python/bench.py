@@ -0,0 +1,110 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import statistics
+import sys
+import time
+from typing import Any
+
+from days import Day, Input, select
+import gen
+import memprofile
+import phases
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    rank = max(math.ceil(q * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+    }
+
+
+def measure(day: Day, input: Input, warmup: int, repeat: int, memory: bool = False) -> dict[str, Any]:
+    for _ in range(warmup):
+        day.solve(input)
+    phases.take()
+    wall = []
+    cpu = []
+    for _ in range(repeat):
+        args = day.arguments(input)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = day.module.solve(*args)
+        cpu.append(time.process_time() - cpu_start)
+        wall.append(time.perf_counter() - wall_start)
+    entry = {
+        "module": day.name,
+        "result": result,
+        "repeat": repeat,
+        "wall": summarize(wall),
+        "cpu": summarize(cpu),
+    }
+    if phases.ENABLED:
+        entry["phases"] = {name: total / repeat for (name, total) in phases.take().items()}
+    if memory:
+        entry["memory"] = memprofile.profile(lambda: day.solve(input))
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the solve functions of the day modules.",
+    )
+    parser.add_argument("modules", nargs="*", help="module names or prefixes, e.g. day01 or day14b2")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument(
+        "--sizes",
+        type=lambda sizes: [int(size) for size in sizes.split(",")],
+        help="sweep over synthetic inputs of these comma separated sizes instead of the real inputs",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument(
+        "--memprofile",
+        action="store_true",
+        help="also run each solver once under tracemalloc and record its peak memory and top allocation sites;"
+        " the profile hook makes that run several times slower than the timed ones, up to 10x on call heavy days",
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    report = []
+    for name in select(args.modules):
+        if args.sizes is not None and gen.find(name) is None:
+            print(f"skipping {name}, it has no input generator", file=sys.stderr)
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            day = Day.load(name)
+        if args.sizes is None:
+            print(f"benchmarking {name}", file=sys.stderr)
+            with contextlib.redirect_stdout(io.StringIO()):
+                report.append(measure(day, day.read_input(), args.warmup, args.repeat, args.memprofile))
+            continue
+        for size in args.sizes:
+            print(f"benchmarking {name} at size {size}", file=sys.stderr)
+            input = gen.generate(name, size, args.seed)
+            with contextlib.redirect_stdout(io.StringIO()):
+                entry = measure(day, input, args.warmup, args.repeat, args.memprofile)
+            report.append({**entry, "size": size, "seed": args.seed})
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
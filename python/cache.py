@@ -0,0 +1,112 @@
+import ast
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from types import ModuleType
+from typing import Any
+
+from days import PYTHON_DIR, Day, Input
+
+DEFAULT_DIRECTORY = Path(os.environ.get("AOC_CACHE_DIR", PYTHON_DIR.parent / ".cache" / "results"))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+MISSING = object()
+
+
+def local_sources(module: ModuleType) -> list[Path]:
+    todo = [Path(module.__file__).resolve()]
+    seen = set()
+    while todo:
+        path = todo.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for node in ast.walk(ast.parse(path.read_text())):
+            if isinstance(node, ast.Import):
+                imported = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module is not None:
+                imported = [node.module]
+            else:
+                continue
+            for name in imported:
+                candidate = PYTHON_DIR / f"{name.split('.')[0]}.py"
+                if candidate.exists():
+                    todo.append(candidate)
+    return sorted(seen)
+
+
+def code_version(module: ModuleType) -> str:
+    digest = hashlib.sha256()
+    for path in local_sources(module):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_digest(input: Input) -> str:
+    data = input.encode() if isinstance(input, str) else repr(input).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache:
+    directory: Path
+    max_bytes: int
+    versions: dict[str, str]
+
+    def __init__(self, directory: Path = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.versions = {}
+
+    def key(self, day: Day, input: Input) -> str:
+        if day.name not in self.versions:
+            self.versions[day.name] = code_version(day.module)
+        parts = [day.name, input_digest(input), self.versions[day.name]]
+        return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> Any:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                result = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return MISSING
+        os.utime(path)
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (fd, temp) = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(result, file)
+        os.replace(temp, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for (_, size, _) in entries)
+        for (_, size, path) in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def solve(self, day: Day, input: Input) -> Any:
+        key = self.key(day, input)
+        result = self.get(key)
+        if result is MISSING:
+            result = day.solve(input)
+            self.put(key, result)
+        return result
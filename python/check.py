@@ -0,0 +1,70 @@
+import argparse
+import subprocess
+import sys
+import traceback
+
+from days import PYTHON_DIR, Day, names as day_names, select
+from selftest import REGISTRY
+
+
+def run(name: str) -> bool:
+    ok = True
+    for test in REGISTRY[name]:
+        try:
+            test()
+        except Exception:
+            ok = False
+            print(f"FAIL {name}.{test.__name__}")
+            traceback.print_exc()
+        else:
+            print(f"ok   {name}.{test.__name__}")
+    return ok
+
+
+IMPORT_TIMER = """\
+import time
+start = time.perf_counter()
+import {name}
+print(time.perf_counter() - start)
+"""
+
+
+def cold_import_time(name: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_TIMER.format(name=name)],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the self-tests of the day modules.",
+    )
+    parser.add_argument("modules", nargs="*", help="module names or prefixes, e.g. day01 or day14b2")
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="report the cold import time of each module instead of running its tests",
+    )
+    args = parser.parse_args()
+
+    names = select(args.modules)
+    if args.import_times:
+        for name in names:
+            print(f"{name:8} {1000 * cold_import_time(name):9.2f} ms")
+        return
+    for name in names:
+        Day.load(name)
+    # Shared modules such as search register their tests when a day imports them.
+    shared = sorted(set(REGISTRY) - set(day_names()))
+    failed = [name for name in names + shared if not run(name)]
+    if failed:
+        sys.exit(f"self-tests failed in {' '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import mmap
+import os
+
+
+def line_bounds(path: str, chunk_size: int) -> list[tuple[int, int]]:
+    # Byte ranges of about chunk_size bytes that each end after a newline.
+    bounds = []
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return bounds
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < len(data):
+                end = data.find(b"\n", min(start + chunk_size, len(data)) - 1)
+                end = len(data) if end < 0 else end + 1
+                bounds.append((start, end))
+                start = end
+    return bounds
+
+
+def read_range(path: str, start: int, end: int) -> bytes:
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return data[start:end]
@@ -0,0 +1,214 @@
+import argparse
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import io
+import tempfile
+
+import numpy as np
+
+import chunks
+from phases import phase
+from selftest import selftest
+
+EXAMPLE = """199
+200
+208
+210
+200
+207
+240
+269
+260
+263"""
+
+
+def parse(data: bytes | str) -> np.ndarray:
+    if isinstance(data, bytes):
+        data = data.decode()
+    if not data.strip():
+        # fromstring reads blank text as a single zero.
+        return np.zeros(0, dtype=np.int64)
+    return np.fromstring(data, dtype=np.int64, sep=" ")
+
+
+def count_increases(depths: np.ndarray, window: int) -> int:
+    # Two sliding sums of width `window` that overlap in all but one reading
+    # differ exactly by the readings `window` apart.
+    if window < 1:
+        raise ValueError(f"window width must be positive, not {window}")
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
+
+
+def count_chunk(
+    path: str,
+    start: int,
+    end: int,
+    windows: list[int],
+) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    depths = parse(chunks.read_range(path, start, end))
+    return [
+        (count_increases(depths, window), depths[:window], depths[-window:])
+        for window in windows
+    ]
+
+
+def count_file(
+    path: str,
+    windows: list[int],
+    workers: int | None = None,
+    chunk_size: int = 1 << 26,
+) -> list[int]:
+    # Each worker counts the increases inside its chunk. Pairs of readings
+    # that straddle a chunk boundary are counted from the last `window`
+    # readings before it and the first `window` readings after it.
+    bounds = chunks.line_bounds(path, chunk_size)
+    results = [0 for _ in windows]
+    carries = [np.zeros(0, dtype=np.int64) for _ in windows]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counted = executor.map(
+            count_chunk,
+            *zip(*[(path, start, end, windows) for (start, end) in bounds]),
+        )
+        for chunk in counted:
+            for (i, (window, (count, head, tail))) in enumerate(zip(windows, chunk)):
+                both = np.concatenate([carries[i], head])
+                straddling = min(len(carries[i]), max(len(both) - window, 0))
+                results[i] += count + int(np.count_nonzero(both[window:window + straddling] > both[:straddling]))
+                carries[i] = np.concatenate([carries[i], tail])[-window:]
+    return results
+
+
+@dataclass(frozen=True)
+class CounterState:
+    counts: tuple[int, ...]
+    recent: tuple[int, ...]
+
+
+class IncreaseCounter:
+    windows: list[int]
+    counts: list[int]
+    recent: deque[int]
+
+    def __init__(self, windows: Iterable[int] = (1, 3)):
+        self.windows = list(windows)
+        if not self.windows or min(self.windows) < 1:
+            raise ValueError(f"window widths must be positive, not {self.windows}")
+        self.counts = [0 for _ in self.windows]
+        self.recent = deque(maxlen=max(self.windows))
+
+    def count(self, window: int) -> int:
+        return self.counts[self.windows.index(window)]
+
+    def push(self, reading: int) -> None:
+        for (i, window) in enumerate(self.windows):
+            if len(self.recent) >= window and reading > self.recent[-window]:
+                self.counts[i] += 1
+        self.recent.append(reading)
+
+    def push_many(self, readings: Iterable[int]) -> None:
+        # Only pairs whose later reading is new are counted, the older one
+        # may still come from the readings kept from before.
+        if isinstance(readings, Iterator):
+            readings = np.fromiter(readings, dtype=np.int64)
+        else:
+            readings = np.asarray(readings, dtype=np.int64)
+        known = len(self.recent)
+        depths = np.concatenate([np.array(self.recent, dtype=np.int64), readings])
+        for (i, window) in enumerate(self.windows):
+            first = max(window, known)
+            self.counts[i] += int(np.count_nonzero(depths[first:] > depths[first - window:len(depths) - window]))
+        self.recent.extend(readings[-self.recent.maxlen:].tolist())
+
+    def snapshot(self) -> CounterState:
+        return CounterState(tuple(self.counts), tuple(self.recent))
+
+    def restore(self, state: CounterState) -> None:
+        self.counts = list(state.counts)
+        self.recent = deque(state.recent, maxlen=self.recent.maxlen)
+
+
+@selftest
+def test_increase_counter():
+    depths = parse(EXAMPLE).tolist()
+    counter = IncreaseCounter()
+    history = []
+    for depth in depths:
+        counter.push(depth)
+        history.append(counter.snapshot())
+    assert (counter.count(1), counter.count(3)) == (7, 5)
+
+    counter.restore(history[3])
+    counter.push_many(depths[4:])
+    assert counter.snapshot() == history[-1]
+
+    counter = IncreaseCounter([3])
+    counter.push(1)
+    counter.push_many([2])
+    assert list(counter.recent) == [1, 2]
+    counter.push(3)
+    assert counter.count(3) == 0
+    counter.push_many([])
+    assert list(counter.recent) == [1, 2, 3]
+
+    for size in [1, 2, 3]:
+        counter = IncreaseCounter([1, 2, 3])
+        for start in range(0, len(depths), size):
+            counter.push_many(depths[start:start + size])
+        assert counter.counts == [count_increases(np.array(depths), window) for window in [1, 2, 3]]
+
+    for split in range(len(depths) + 1):
+        counter = IncreaseCounter([1, 2, 3])
+        counter.push_many(depths[:split])
+        counter.push_many(iter(depths[split:]))
+        assert counter.counts == [count_increases(np.array(depths), window) for window in [1, 2, 3]]
+
+
+def solve(reader: io.TextIOBase) -> tuple[int, int]:
+    with phase("parse"):
+        depths = parse(reader.read())
+    with phase("aggregate"):
+        return (count_increases(depths, 1), count_increases(depths, 3))
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == (7, 5)
+    depths = parse(EXAMPLE)
+    assert count_increases(depths, 10) == 0
+    assert count_increases(depths, 20) == 0
+    assert len(parse("\n\n")) == 0
+
+
+@selftest
+def test_count_file():
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(EXAMPLE + "\n")
+        file.flush()
+        for chunk_size in [1, 5, 12, 1000]:
+            assert count_file(file.name, [1, 3], 2, chunk_size) == [7, 5]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count increasing depth readings.")
+    parser.add_argument("file", nargs="?", default="input/day01.txt")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="memory-map the file and count it in chunks on this many processes",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1 << 26, help="bytes per chunk with --workers")
+    args = parser.parse_args()
+
+    if args.workers is None:
+        with open(args.file) as file:
+            (increases, sum_increases) = solve(file)
+    else:
+        [increases, sum_increases] = count_file(args.file, [1, 3], args.workers, args.chunk_size)
+    print(f"{increases} measurements are larger")
+    print(f"{sum_increases} sums are larger")
+
+
+if __name__ == "__main__":
+    main()
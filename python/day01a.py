@@ -1,15 +1,19 @@
-import math
+import io
+
+from day01 import count_increases, parse
+from phases import phase
+
+
+def solve(reader: io.TextIOBase) -> int:
+    with phase("parse"):
+        depths = parse(reader.read())
+    with phase("aggregate"):
+        return count_increases(depths, 1)
 
 
 def main():
     with open("input/day01.txt") as file:
-        result = 0
-        last = math.inf
-        for line in file.readlines():
-            current = int(line)
-            if current > last:
-                result += 1
-            last = current
+        result = solve(file)
         print(f"{result} measurements are larger")
 
 
@@ -1,16 +1,19 @@
-from collections import deque
+import io
+
+from day01 import count_increases, parse
+from phases import phase
+
+
+def solve(reader: io.TextIOBase) -> int:
+    with phase("parse"):
+        depths = parse(reader.read())
+    with phase("aggregate"):
+        return count_increases(depths, 3)
 
 
 def main():
     with open("input/day01.txt") as file:
-        result = 0
-        window = deque()
-        for line in file.readlines():
-            window.append(int(line))
-            if len(window) == 4:
-                if window[-1] > window[0]:
-                    result += 1
-                window.popleft()
+        result = solve(file)
         print(f"{result} sums are larger")
 
 
@@ -0,0 +1,226 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+import io
+import tempfile
+
+import numpy as np
+
+import chunks
+from phases import phase
+from selftest import selftest
+
+EXAMPLE = """forward 5
+down 5
+forward 8
+up 3
+down 8
+forward 2"""
+
+
+@dataclass(frozen=True)
+class Segment:
+    # The effect of a run of commands on a submarine starting with an aim of
+    # zero. Starting with aim a instead adds a * forward to the depth, so
+    # every segment is an affine map of (position, depth, aim) and segments
+    # compose associatively.
+    forward: int = 0
+    depth: int = 0
+    aim: int = 0
+
+    def then(self, other):
+        return Segment(
+            forward=self.forward + other.forward,
+            depth=self.depth + other.depth + self.aim * other.forward,
+            aim=self.aim + other.aim,
+        )
+
+    @staticmethod
+    def parse(data: bytes | str):
+        (forward, turn) = commands(data)
+        aim = np.cumsum(turn)
+        return Segment(
+            forward=int(forward.sum()),
+            depth=int(np.dot(aim, forward)),
+            aim=int(aim[-1]) if len(aim) > 0 else 0,
+        )
+
+    def answers(self) -> tuple[int, int]:
+        # Without aim, the first part's depth is what the second part calls aim.
+        return (self.forward * self.aim, self.forward * self.depth)
+
+
+def commands(data: bytes | str) -> tuple[np.ndarray, np.ndarray]:
+    # Returns how far each command moves forward and how much it turns the
+    # aim. Commands are told apart by their first byte and the arguments are
+    # read digit by digit backwards from the line ends, all lines at once.
+    # Blanks around a line are skipped, like str.split does.
+    if isinstance(data, str):
+        data = data.encode()
+    data = data.replace(b"\r", b"").strip() + b"\n"
+    if data == b"\n":
+        return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    text = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(text == ord("\n"))
+    blank = (text == ord(" ")) | (text == ord("\t"))
+    # The stripped data starts with a command and ends with a newline, so
+    # neither walk can leave the buffer.
+    starts = np.concatenate([[0], newlines[:-1] + 1])
+    while np.any(step := blank[starts]):
+        starts += step
+    ends = newlines.copy()
+    while np.any(step := blank[ends - 1]):
+        ends -= step
+    kinds = text[starts]
+
+    args = np.zeros(len(ends), dtype=np.int64)
+    in_number = np.ones(len(ends), dtype=bool)
+    scale = 1
+    for place in range(1, 19):
+        digits = text[np.maximum(ends - place, 0)] - np.uint8(ord("0"))
+        in_number &= digits <= 9
+        if place == 1 and not np.all(in_number):
+            raise Exception("command without argument")
+        if not np.any(in_number):
+            break
+        args += np.where(in_number, digits, 0) * np.int64(scale)
+        scale *= 10
+
+    is_forward = kinds == ord("f")
+    is_down = kinds == ord("d")
+    is_up = kinds == ord("u")
+    if not np.all(is_forward | is_down | is_up):
+        raise Exception("unknown command")
+    return (np.where(is_forward, args, 0), np.where(is_down, args, 0) - np.where(is_up, args, 0))
+
+
+class CourseIndex:
+    # Prefix arrays over the course: entry k describes the submarine after
+    # its first k commands.
+    forward: np.ndarray
+    depth: np.ndarray
+    aim: np.ndarray
+    deepest: np.ndarray
+
+    def __init__(self, data: bytes | str):
+        (forward, turn) = commands(data)
+        zero = np.zeros(1, dtype=np.int64)
+        self.forward = np.concatenate([zero, np.cumsum(forward)])
+        self.aim = np.concatenate([zero, np.cumsum(turn)])
+        self.depth = np.concatenate([zero, np.cumsum(self.aim[:-1] * forward)])
+        # The depth goes up and down, its running maximum is sorted.
+        self.deepest = np.maximum.accumulate(self.depth)
+
+    def __len__(self) -> int:
+        return len(self.forward) - 1
+
+    def position(self, step: int) -> Segment:
+        if not 0 <= step <= len(self):
+            raise IndexError(f"step {step} is not on a course of {len(self)} steps")
+        return Segment(int(self.forward[step]), int(self.depth[step]), int(self.aim[step]))
+
+    def first_deeper(self, threshold: int) -> int | None:
+        step = int(np.searchsorted(self.deepest, threshold, side="right"))
+        return step if step <= len(self) else None
+
+
+def reduce_chunk(path: str, start: int, end: int) -> Segment:
+    return Segment.parse(chunks.read_range(path, start, end))
+
+
+def replay_file(path: str, workers: int | None = None, chunk_size: int = 1 << 24) -> Segment:
+    bounds = chunks.line_bounds(path, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        segments = executor.map(reduce_chunk, *zip(*[(path, start, end) for (start, end) in bounds]))
+        return reduce(Segment.then, segments, Segment())
+
+
+def solve(reader: io.TextIOBase) -> tuple[int, int]:
+    with phase("parse"):
+        course = Segment.parse(reader.read())
+    with phase("aggregate"):
+        return course.answers()
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == (150, 900)
+
+
+@selftest
+def test_commands():
+    (forward, turn) = commands("forward 10\r\ndown 123\nup 7\n\n")
+    assert forward.tolist() == [10, 0, 0]
+    assert turn.tolist() == [0, 123, -7]
+    (forward, turn) = commands("forward 5 \n down 8\t\r\nup 3 \t\nforward 2")
+    assert forward.tolist() == [5, 0, 0, 2]
+    assert turn.tolist() == [0, 8, -3, 0]
+    for bad in ["forward 5\n \nup 3", "forward \n"]:
+        try:
+            commands(bad)
+            assert False
+        except Exception as error:
+            assert str(error) == "command without argument"
+    assert Segment.parse("") == Segment()
+
+
+@selftest
+def test_course_index():
+    index = CourseIndex(EXAMPLE)
+    assert len(index) == 6
+    assert index.position(0) == Segment()
+    assert index.position(6) == Segment.parse(EXAMPLE)
+    lines = EXAMPLE.splitlines()
+    for step in range(len(lines) + 1):
+        assert index.position(step) == Segment.parse("\n".join(lines[:step]))
+    assert index.first_deeper(-1) == 0
+    assert index.first_deeper(0) == 3
+    assert index.first_deeper(39) == 3
+    assert index.first_deeper(40) == 6
+    assert index.first_deeper(59) == 6
+    assert index.first_deeper(60) is None
+
+
+@selftest
+def test_then():
+    lines = EXAMPLE.splitlines()
+    whole = Segment.parse(EXAMPLE)
+    for split in range(len(lines) + 1):
+        head = Segment.parse("\n".join(lines[:split]))
+        tail = Segment.parse("\n".join(lines[split:]))
+        assert head.then(tail) == whole
+    assert Segment().then(whole) == whole.then(Segment()) == whole
+
+
+@selftest
+def test_replay_file():
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(EXAMPLE)
+        file.flush()
+        for chunk_size in [1, 7, 16, 1000]:
+            assert replay_file(file.name, 2, chunk_size) == Segment.parse(EXAMPLE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Follow the planned course of the submarine.")
+    parser.add_argument("file", nargs="?", default="input/day02.txt")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="memory-map the file and replay it in chunks on this many processes",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1 << 24, help="bytes per chunk with --workers")
+    args = parser.parse_args()
+
+    if args.workers is None:
+        with open(args.file) as file:
+            (result_a, result_b) = solve(file)
+    else:
+        (result_a, result_b) = replay_file(args.file, args.workers, args.chunk_size).answers()
+    print(f"The product of the final position is {result_a}")
+    print(f"The product of the final position with aim is {result_b}")
+
+
+if __name__ == "__main__":
+    main()
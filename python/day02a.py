@@ -1,21 +1,21 @@
-import math
+import io
+
+from day02 import Segment
+from phases import phase
+
+
+def solve(reader: io.TextIOBase) -> int:
+    with phase("parse"):
+        course = Segment.parse(reader.read())
+    with phase("aggregate"):
+        (result, _) = course.answers()
+    return result
 
 
 def main():
     with open("input/day02.txt") as file:
-        (x_pos, y_pos) = (0, 0)
-        for line in file.readlines():
-            [cmd, arg] = line.split()
-            arg = int(arg)
-            if cmd == "forward":
-                x_pos += arg
-            elif cmd == "down":
-                y_pos += arg
-            elif cmd == "up":
-                y_pos -= arg
-            else:
-                raise Exception("unknown command")
-        print(f"The product of the final position is {x_pos * y_pos}")
+        result = solve(file)
+        print(f"The product of the final position is {result}")
 
 
 if __name__ == "__main__":
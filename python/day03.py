@@ -0,0 +1,184 @@
+from bisect import bisect_left
+import io
+
+import numpy as np
+
+import grid
+from phases import phase
+from selftest import selftest
+
+EXAMPLE_INPUT = """00100
+11110
+10110
+10111
+10101
+01111
+00111
+11100
+10000
+11001
+00010
+01010"""
+
+
+def parse_report(data):
+    return grid.parse(data) == ord("1")
+
+
+def to_int(bits):
+    # Bits are packed into bytes, most significant first, which leaves
+    # padding at the low end of the last byte.
+    padding = -len(bits) % 8
+    return int.from_bytes(np.packbits(bits).tobytes(), "big") >> padding
+
+
+def majority_bits(report):
+    (total, _) = report.shape
+    return 2 * report.sum(axis=0, dtype=np.int64) >= total
+
+
+def power_consumption(report):
+    (_, size) = report.shape
+    gamma = to_int(majority_bits(report))
+    epsilon = ((1 << size) - 1) ^ gamma
+    return gamma * epsilon
+
+
+class SortedReport:
+    # Numbers that agree on all bits above some bit are contiguous when
+    # sorted, with those that have it clear first. So every filter step only
+    # bisects for the split point inside the current range.
+    def __init__(self, numbers, size):
+        self.numbers = sorted(numbers)
+        self.size = size
+
+    @staticmethod
+    def from_report(report):
+        (_, size) = report.shape
+        if size > 62:
+            return SortedReport([to_int(row) for row in report], size)
+        numbers = report.astype(np.int64) @ (1 << np.arange(size - 1, -1, -1, dtype=np.int64))
+        return SortedReport(np.sort(numbers).tolist(), size)
+
+    def rating(self, keep_majority):
+        numbers = self.numbers
+        (lo, hi) = (0, len(numbers))
+        for bit in reversed(range(self.size)):
+            if hi - lo <= 1:
+                break
+            prefix = numbers[lo] >> (bit + 1) << (bit + 1)
+            split = bisect_left(numbers, prefix | (1 << bit), lo, hi)
+            keep_ones = (2 * (hi - split) >= hi - lo) == keep_majority
+            (lo, hi) = (split, hi) if keep_ones else (lo, split)
+        if lo == hi:
+            raise ValueError("no number is left to rate")
+        return numbers[lo]
+
+    def life_support(self):
+        return self.rating(True) * self.rating(False)
+
+
+class SlicedReport:
+    # Column c of the report as one int whose bit r is the bit of row r, so
+    # that counting and filtering rows work on whole machine words. Filters
+    # usually settle after a few columns, so columns are sliced on demand.
+    def __init__(self, report):
+        self.report = report
+        (self.rows, size) = report.shape
+        self.columns = size * [None]
+
+    def column(self, index):
+        if self.columns[index] is None:
+            packed = np.packbits(self.report[:, index], bitorder="little")
+            self.columns[index] = int.from_bytes(packed.tobytes(), "little")
+        return self.columns[index]
+
+    def power_consumption(self):
+        gamma = 0
+        for index in range(len(self.columns)):
+            gamma = 2 * gamma + (2 * self.column(index).bit_count() >= self.rows)
+        epsilon = ((1 << len(self.columns)) - 1) ^ gamma
+        return gamma * epsilon
+
+    def rating(self, keep_majority):
+        alive = (1 << self.rows) - 1
+        for index in range(len(self.columns)):
+            column = self.column(index)
+            count = alive.bit_count()
+            if count <= 1:
+                break
+            ones = alive & column
+            keep_ones = (2 * ones.bit_count() >= count) == keep_majority
+            alive = ones if keep_ones else alive & ~column
+        if alive == 0:
+            raise ValueError("no number is left to rate")
+        return to_int(self.report[(alive & -alive).bit_length() - 1])
+
+    def life_support(self):
+        return self.rating(True) * self.rating(False)
+
+
+def life_support(report):
+    return SlicedReport(report).life_support()
+
+
+def solve(reader):
+    with phase("parse"):
+        report = parse_report(reader.read())
+    with phase("aggregate"):
+        power = power_consumption(report)
+    with phase("search"):
+        rating = life_support(report)
+    return (power, rating)
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE_INPUT)) == (198, 230)
+
+
+@selftest
+def test_to_int():
+    assert to_int(np.array([], dtype=bool)) == 0
+    assert to_int(np.array([True, False, True])) == 5
+    wide = np.zeros(200, dtype=bool)
+    wide[0] = wide[-1] = True
+    assert to_int(wide) == (1 << 199) + 1
+
+
+@selftest
+def test_sorted_report():
+    report = SortedReport.from_report(parse_report(EXAMPLE_INPUT))
+    assert report.rating(True) == 23
+    assert report.rating(False) == 10
+    assert SortedReport([5], 3).life_support() == 25
+    wide = parse_report("1" + 70 * "0" + "\n0" + 70 * "1")
+    assert SortedReport.from_report(wide).numbers == [(1 << 70) - 1, 1 << 70]
+
+
+@selftest
+def test_sliced_report():
+    report = parse_report(EXAMPLE_INPUT)
+    sliced = SlicedReport(report)
+    assert sliced.column(0) == 0b001110011110
+    assert sliced.power_consumption() == power_consumption(report) == 198
+    assert (sliced.rating(True), sliced.rating(False)) == (23, 10)
+
+    lines = EXAMPLE_INPUT.split()
+    wide = parse_report("\n".join(line + 60 * "0" + line for line in lines))
+    sorted_report = SortedReport.from_report(wide)
+    sliced = SlicedReport(wide)
+    assert sliced.power_consumption() == power_consumption(wide)
+    assert sliced.rating(True) == sorted_report.rating(True)
+    assert sliced.rating(False) == sorted_report.rating(False)
+
+
+def main():
+    with open("../input/day03.txt") as file:
+        (power, life) = solve(file)
+        print(f"The power consumption of the submarine is {power}")
+        print(f"The life support rating of the submarine is {life}")
+
+
+if __name__ == "__main__":
+    main()
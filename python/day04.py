@@ -0,0 +1,193 @@
+import argparse
+from collections.abc import Iterator
+import io
+from itertools import islice
+from typing import Optional
+
+import numpy as np
+
+from phases import phase
+from selftest import selftest
+
+EXAMPLE = """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
+
+22 13 17 11  0
+ 8  2 23  4 24
+21  9 14 16  7
+ 6 10  3 18  5
+ 1 12 20 15 19
+
+ 3 15  0  2 22
+ 9 18 13 17  5
+19  8  7 25 23
+20 11 10 24  4
+14 21 16 12  6
+
+14 21 17 24  4
+10 16 15  9 19
+18  8 23 26 20
+22 11 13  6  5
+ 2  0 12  3  7"""
+
+
+def parse(data: str) -> tuple[np.ndarray, np.ndarray]:
+    (header, _, rest) = data.partition("\n")
+    numbers = np.array(header.strip().split(","), dtype=np.int64)
+    boards = np.fromstring(rest, dtype=np.int64, sep=" ").reshape(-1, 5, 5)
+    return (numbers, boards)
+
+
+def rank_table(numbers: np.ndarray) -> np.ndarray:
+    ranks = np.full(numbers.max(initial=0) + 1, len(numbers), dtype=np.int64)
+    (drawn, first) = np.unique(numbers, return_index=True)
+    ranks[drawn] = first
+    return ranks
+
+
+def draw_ranks(numbers: np.ndarray, boards: np.ndarray, table: Optional[np.ndarray] = None) -> np.ndarray:
+    # The position at which each cell is drawn, len(numbers) if never.
+    if table is None:
+        table = rank_table(numbers)
+    drawn = boards < len(table)
+    return np.where(drawn, table[np.where(drawn, boards, 0)], len(numbers))
+
+
+def win_ranks(cell_ranks: np.ndarray) -> np.ndarray:
+    # A line is complete once its last cell is drawn, a board once its first
+    # line is complete.
+    rows = cell_ranks.max(axis=2).min(axis=1)
+    cols = cell_ranks.max(axis=1).min(axis=1)
+    return np.minimum(rows, cols)
+
+
+def score(numbers: np.ndarray, boards: np.ndarray, cell_ranks: np.ndarray, wins: np.ndarray, board: int) -> Optional[int]:
+    win = wins[board]
+    if win == len(numbers):
+        return None
+    unmarked = boards[board][cell_ranks[board] > win]
+    return int(unmarked.sum() * numbers[win])
+
+
+class Bingo:
+    # Postings map each number to the flat indices (5 * board + row and
+    # 5 * board + col) of the lines it is on, so a draw only touches the
+    # boards containing it.
+    postings: dict[int, list[tuple[int, int, int]]]
+    row_hits: list[int]
+    col_hits: list[int]
+    unmarked: list[int]
+    won: list[bool]
+
+    def __init__(self, boards: np.ndarray):
+        self.postings = {}
+        for (board, cells) in enumerate(boards.tolist()):
+            for (i, row) in enumerate(cells):
+                for (j, cell) in enumerate(row):
+                    self.postings.setdefault(cell, []).append((board, 5 * board + i, 5 * board + j))
+        self.row_hits = [0] * (5 * len(boards))
+        self.col_hits = [0] * (5 * len(boards))
+        self.unmarked = boards.sum(axis=(1, 2)).tolist()
+        self.won = [False] * len(boards)
+
+    def draw(self, number: int) -> list[int]:
+        winners = []
+        for (board, row, col) in self.postings.pop(number, []):
+            if self.won[board]:
+                continue
+            self.unmarked[board] -= number
+            self.row_hits[row] += 1
+            self.col_hits[col] += 1
+            if self.row_hits[row] == 5 or self.col_hits[col] == 5:
+                self.won[board] = True
+                winners.append(board)
+        return winners
+
+    def score(self, board: int, number: int) -> int:
+        return self.unmarked[board] * number
+
+
+def solve(reader: io.TextIOBase) -> tuple[Optional[int], Optional[int]]:
+    with phase("parse"):
+        (numbers, boards) = parse(reader.read())
+    with phase("build"):
+        cell_ranks = draw_ranks(numbers, boards)
+        wins = win_ranks(cell_ranks)
+    with phase("aggregate"):
+        # argmin and argmax pick the first board among ties, like drawing does.
+        first = score(numbers, boards, cell_ranks, wins, int(np.argmin(wins)))
+        last = score(numbers, boards, cell_ranks, wins, int(np.argmax(wins)))
+    return (first, last)
+
+
+def batches(reader: io.TextIOBase, size: int) -> Iterator[np.ndarray]:
+    rest = np.zeros(0, dtype=np.int64)
+    while True:
+        text = "".join(islice(reader, 6 * size))
+        if not text:
+            break
+        if not text.strip():
+            continue
+        cells = np.concatenate([rest, np.fromstring(text, dtype=np.int64, sep=" ")])
+        cut = len(cells) - len(cells) % 25
+        rest = cells[cut:]
+        if cut > 0:
+            yield cells[:cut].reshape(-1, 5, 5)
+    if len(rest) > 0:
+        raise ValueError(f"the last board has only {len(rest)} cells")
+
+
+def stream(reader: io.TextIOBase, batch: int = 4096) -> tuple[Optional[int], Optional[int]]:
+    # Reads the boards once, a bounded batch at a time, and keeps only the
+    # running first and last winners as (win rank, score).
+    numbers = np.array(reader.readline().strip().split(","), dtype=np.int64)
+    table = rank_table(numbers)
+    first = None
+    last = None
+    for boards in batches(reader, batch):
+        cell_ranks = draw_ranks(numbers, boards, table)
+        wins = win_ranks(cell_ranks)
+        i = int(np.argmin(wins))
+        if first is None or wins[i] < first[0]:
+            first = (wins[i], score(numbers, boards, cell_ranks, wins, i))
+        j = int(np.argmax(wins))
+        if last is None or wins[j] > last[0]:
+            last = (wins[j], score(numbers, boards, cell_ranks, wins, j))
+    return (first and first[1], last and last[1])
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == (4512, 1924)
+
+
+@selftest
+def test_stream():
+    for batch in [1, 2, 3, 100]:
+        assert stream(io.StringIO(EXAMPLE), batch) == (4512, 1924)
+
+
+@selftest
+def test_bingo():
+    (numbers, boards) = parse(EXAMPLE)
+    bingo = Bingo(boards)
+    scores = []
+    for number in numbers.tolist():
+        scores.extend(bingo.score(board, number) for board in bingo.draw(number))
+    assert bingo.draw(int(numbers[0])) == []
+    assert scores == [4512, 2192, 1924]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the first and last winning bingo boards.")
+    parser.add_argument("file", nargs="?", default="input/day04.txt")
+    parser.add_argument("--stream", action="store_true", help="read the boards in batches and keep only the winners")
+    args = parser.parse_args()
+
+    with open(args.file) as file:
+        (first, last) = stream(file) if args.stream else solve(file)
+        print(f"The final score will be {first}")
+        print(f"The final score of the last board will be {last}")
+
+
+if __name__ == "__main__":
+    main()
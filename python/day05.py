@@ -0,0 +1,387 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+import io
+import math
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
+
+from phases import phase
+from selftest import selftest
+
+EXAMPLE = """0,9 -> 5,9
+8,0 -> 0,8
+9,4 -> 3,4
+2,2 -> 2,1
+7,0 -> 7,4
+6,4 -> 2,0
+0,9 -> 2,9
+3,4 -> 1,4
+0,0 -> 8,8
+5,5 -> 8,2"""
+
+# Dense rasters are used up to this many cells, hash counting up to this many
+# points and the line index beyond.
+MAX_CELLS = 1 << 24
+
+# Segments are rasterized in blocks of about this many points.
+BLOCK_POINTS = 1 << 22
+
+
+def parse(data: str) -> np.ndarray:
+    # One row (x1, y1, x2, y2) per segment.
+    text = data.replace("->", " ").replace(",", " ")
+    if not text.strip():
+        return np.zeros((0, 4), dtype=np.int64)
+    return np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 4)
+
+
+def axis_aligned(segments: np.ndarray) -> np.ndarray:
+    (x1, y1, x2, y2) = segments.T
+    return segments[(x1 == x2) | (y1 == y2)]
+
+
+def points(segments: np.ndarray) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    # All points of horizontal, vertical and diagonal segments, a block of
+    # segments at a time to bound the memory.
+    (x1, y1, x2, y2) = segments.T
+    (dx, dy) = (np.sign(x2 - x1), np.sign(y2 - y1))
+    lengths = np.maximum(abs(x2 - x1), abs(y2 - y1)) + 1
+    ends = np.cumsum(lengths)
+    start = 0
+    while start < len(segments):
+        done = ends[start - 1] if start > 0 else 0
+        stop = max(int(np.searchsorted(ends, done + BLOCK_POINTS, side="right")), start + 1)
+        block = np.repeat(np.arange(start, stop), lengths[start:stop])
+        steps = np.arange(len(block)) - np.repeat(ends[start:stop] - lengths[start:stop] - done, lengths[start:stop])
+        yield (x1[block] + dx[block] * steps, y1[block] + dy[block] * steps)
+        start = stop
+
+
+@dataclass
+class Raster:
+    # counts[y - y_min, x - x_min] is the number of segments through (x, y).
+    counts: np.ndarray
+    x_min: int
+    y_min: int
+
+    @staticmethod
+    def build(segments: np.ndarray):
+        (x_min, y_min, x_max, y_max) = bounds(segments)
+        (width, height) = (x_max - x_min + 1, y_max - y_min + 1)
+        counts = np.zeros(width * height, dtype=np.int64)
+        for (xs, ys) in points(segments):
+            counts += np.bincount((ys - y_min) * width + (xs - x_min), minlength=width * height)
+        return Raster(counts.reshape(height, width), x_min, y_min)
+
+
+@dataclass
+class DangerIndex:
+    # table[y + 1, x + 1] is the number of points covered at least twice in
+    # the raster up to and including (x, y), relative to the origin.
+    table: np.ndarray
+    x_min: int
+    y_min: int
+
+    @staticmethod
+    def build(segments: np.ndarray):
+        (x_min, y_min, x_max, y_max) = bounds(segments)
+        (width, height) = (x_max - x_min + 1, y_max - y_min + 1)
+        if width * height > MAX_CELLS:
+            # This also keeps the running counts well within int32.
+            raise ValueError(f"the segments span {width}x{height} points, more than {MAX_CELLS} can be indexed")
+        raster = Raster.build(segments)
+        table = np.zeros((raster.counts.shape[0] + 1, raster.counts.shape[1] + 1), dtype=np.int32)
+        table[1:, 1:] = (raster.counts >= 2).cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+        return DangerIndex(table, raster.x_min, raster.y_min)
+
+    def count(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        # Dangerous points in the rectangle with corners (x1, y1) and (x2, y2).
+        (height, width) = (self.table.shape[0] - 1, self.table.shape[1] - 1)
+        (i1, i2) = sorted([y1 - self.y_min, y2 - self.y_min])
+        (j1, j2) = sorted([x1 - self.x_min, x2 - self.x_min])
+        (i1, j1) = (max(i1, 0), max(j1, 0))
+        (i2, j2) = (min(i2, height - 1) + 1, min(j2, width - 1) + 1)
+        if i1 >= i2 or j1 >= j2:
+            return 0
+        table = self.table
+        return int(table[i2, j2] - table[i1, j2] - table[i2, j1] + table[i1, j1])
+
+    def save(self, path: Path) -> None:
+        (fd, temp) = tempfile.mkstemp(dir=Path(path).parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            np.savez_compressed(file, table=self.table, origin=np.array([self.x_min, self.y_min]))
+        os.replace(temp, path)
+
+    @staticmethod
+    def load(path: Path):
+        with np.load(path) as data:
+            (x_min, y_min) = data["origin"].tolist()
+            return DangerIndex(data["table"], x_min, y_min)
+
+
+def bounds(segments: np.ndarray) -> tuple[int, int, int, int]:
+    xs = segments[:, [0, 2]]
+    ys = segments[:, [1, 3]]
+    return (int(xs.min(initial=0)), int(ys.min(initial=0)), int(xs.max(initial=0)), int(ys.max(initial=0)))
+
+
+class Line(Enum):
+    HORIZONTAL = 0
+    VERTICAL = 1
+    DIAGONAL = 2
+    ANTIDIAGONAL = 3
+
+
+Interval = tuple[int, int]
+
+
+def carrying_line(x1: int, y1: int, x2: int, y2: int) -> tuple[Line, int, Interval]:
+    # The line through a segment, identified by the coordinate that is
+    # constant along it, and the segment as an interval of the other one.
+    if y1 == y2:
+        return (Line.HORIZONTAL, y1, (min(x1, x2), max(x1, x2)))
+    if x1 == x2:
+        return (Line.VERTICAL, x1, (min(y1, y2), max(y1, y2)))
+    if x1 - y1 == x2 - y2:
+        return (Line.DIAGONAL, x1 - y1, (min(x1, x2), max(x1, x2)))
+    if x1 + y1 == x2 + y2:
+        return (Line.ANTIDIAGONAL, x1 + y1, (min(x1, x2), max(x1, x2)))
+    raise ValueError(f"{x1},{y1} -> {x2},{y2} is neither straight nor diagonal")
+
+
+def position(kind: Line, x: int, y: int) -> tuple[int, int]:
+    match kind:
+        case Line.HORIZONTAL: return (y, x)
+        case Line.VERTICAL: return (x, y)
+        case Line.DIAGONAL: return (x - y, x)
+        case Line.ANTIDIAGONAL: return (x + y, x)
+
+
+def merge(intervals: list[Interval]) -> tuple[list[Interval], list[Interval]]:
+    # The points covered at least once and at least twice, as sorted lists of
+    # disjoint intervals. Any point of an interval up to the furthest end of
+    # the intervals starting before it is covered twice.
+    union: list[Interval] = []
+    double: list[Interval] = []
+    reach = -math.inf
+    for (lo, hi) in sorted(intervals):
+        if lo <= reach:
+            overlap = (lo, min(hi, reach))
+            if double and overlap[0] <= double[-1][1] + 1:
+                double[-1] = (double[-1][0], max(double[-1][1], overlap[1]))
+            else:
+                double.append(overlap)
+        if union and lo <= union[-1][1] + 1:
+            union[-1] = (union[-1][0], max(union[-1][1], hi))
+        else:
+            union.append((lo, hi))
+        reach = max(reach, hi)
+    return (union, double)
+
+
+@selftest
+def test_merge():
+    assert merge([(0, 5), (7, 9), (3, 8), (10, 10)]) == ([(0, 10)], [(3, 5), (7, 8)])
+    assert merge([(1, 1), (1, 1), (1, 1)]) == ([(1, 1)], [(1, 1)])
+
+
+def crossings(horizontals: list[tuple[int, int, int]], verticals: list[tuple[int, int, int]]) -> Iterator[tuple[int, int]]:
+    # Sweeps over u with the v of the horizontals (v, u_lo, u_hi) that are
+    # active in a sorted list, and reports where a vertical (u, v_lo, v_hi)
+    # meets one of them. The horizontals on one line are disjoint, so every
+    # active v is distinct.
+    events = []
+    for (v, lo, hi) in horizontals:
+        events.append((lo, 0, v, v))
+        events.append((hi, 2, v, v))
+    for (u, lo, hi) in verticals:
+        events.append((u, 1, lo, hi))
+    events.sort()
+    active: list[int] = []
+    for (u, event, lo, hi) in events:
+        if event == 0:
+            insort(active, lo)
+        elif event == 2:
+            del active[bisect_left(active, lo)]
+        else:
+            for v in active[bisect_left(active, lo):bisect_right(active, hi)]:
+                yield (u, v)
+
+
+Frame = Callable[[int, int, int], tuple[int, int, int]]
+
+# For every two kinds of lines, a frame (u, v) in which lines of the first kind
+# are horizontal and lines of the second one vertical, how their intervals
+# look in that frame and how to get back to (x, y), if it is a lattice point.
+FRAMES: list[tuple[Line, Frame, Line, Frame, Callable[[int, int], tuple[int, int] | None]]] = [
+    (
+        Line.HORIZONTAL, lambda c, lo, hi: (c, lo, hi),
+        Line.VERTICAL, lambda c, lo, hi: (c, lo, hi),
+        lambda u, v: (u, v),
+    ),
+    (
+        Line.HORIZONTAL, lambda c, lo, hi: (c, lo - c, hi - c),
+        Line.DIAGONAL, lambda c, lo, hi: (c, lo - c, hi - c),
+        lambda u, v: (u + v, v),
+    ),
+    (
+        Line.HORIZONTAL, lambda c, lo, hi: (c, lo + c, hi + c),
+        Line.ANTIDIAGONAL, lambda c, lo, hi: (c, c - hi, c - lo),
+        lambda u, v: (u - v, v),
+    ),
+    (
+        Line.DIAGONAL, lambda c, lo, hi: (c, lo, hi),
+        Line.VERTICAL, lambda c, lo, hi: (c, c - hi, c - lo),
+        lambda u, v: (u, u - v),
+    ),
+    (
+        Line.ANTIDIAGONAL, lambda c, lo, hi: (c, lo, hi),
+        Line.VERTICAL, lambda c, lo, hi: (c, c + lo, c + hi),
+        lambda u, v: (u, v - u),
+    ),
+    (
+        Line.ANTIDIAGONAL, lambda c, lo, hi: (c, 2 * lo - c, 2 * hi - c),
+        Line.DIAGONAL, lambda c, lo, hi: (c, 2 * lo - c, 2 * hi - c),
+        lambda u, v: ((u + v) // 2, (v - u) // 2) if (u + v) % 2 == 0 else None,
+    ),
+]
+
+
+class LineIndex:
+    union: dict[tuple[Line, int], list[Interval]]
+    double: dict[tuple[Line, int], list[Interval]]
+
+    def __init__(self, segments: np.ndarray):
+        lines: dict[tuple[Line, int], list[Interval]] = {}
+        for (x1, y1, x2, y2) in segments.tolist():
+            (kind, c, interval) = carrying_line(x1, y1, x2, y2)
+            lines.setdefault((kind, c), []).append(interval)
+        self.union = {}
+        self.double = {}
+        for (line, intervals) in lines.items():
+            (self.union[line], double) = merge(intervals)
+            if double:
+                self.double[line] = double
+
+    def covered_twice(self, kind: Line, x: int, y: int) -> bool:
+        (c, t) = position(kind, x, y)
+        intervals = self.double.get((kind, c), [])
+        i = bisect_right(intervals, (t, math.inf)) - 1
+        return i >= 0 and intervals[i][1] >= t
+
+    def crossing_points(self) -> set[tuple[int, int]]:
+        points = set()
+        for (kind1, frame1, kind2, frame2, back) in FRAMES:
+            horizontals = [
+                frame1(c, lo, hi)
+                for ((kind, c), intervals) in self.union.items() if kind == kind1
+                for (lo, hi) in intervals
+            ]
+            verticals = [
+                frame2(c, lo, hi)
+                for ((kind, c), intervals) in self.union.items() if kind == kind2
+                for (lo, hi) in intervals
+            ]
+            for (u, v) in crossings(horizontals, verticals):
+                point = back(u, v)
+                if point is not None:
+                    points.add(point)
+        return points
+
+    def overlaps(self) -> int:
+        # Points covered twice on a single line are counted by length. A point
+        # where lines cross is covered twice anyway and must count once, no
+        # matter on how many of its lines it was already covered twice.
+        result = sum(hi - lo + 1 for intervals in self.double.values() for (lo, hi) in intervals)
+        for (x, y) in self.crossing_points():
+            result += 1 - sum(self.covered_twice(kind, x, y) for kind in Line)
+        return result
+
+
+def count_overlaps(segments: np.ndarray) -> int:
+    (x_min, y_min, x_max, y_max) = bounds(segments)
+    (width, height) = (x_max - x_min + 1, y_max - y_min + 1)
+    if width * height <= MAX_CELLS:
+        return int(np.count_nonzero(Raster.build(segments).counts >= 2))
+    (x1, y1, x2, y2) = segments.T
+    if int(np.maximum(abs(x2 - x1), abs(y2 - y1)).sum()) + len(segments) > MAX_CELLS:
+        return LineIndex(segments).overlaps()
+    counter: Counter[int | tuple[int, int]] = Counter()
+    for (xs, ys) in points(segments):
+        if width * height < 1 << 63:
+            counter.update(((ys - y_min) * width + (xs - x_min)).tolist())
+        else:
+            counter.update(zip(xs.tolist(), ys.tolist()))
+    return sum(1 for count in counter.values() if count >= 2)
+
+
+def solve(reader: io.TextIOBase) -> tuple[int, int]:
+    with phase("parse"):
+        segments = parse(reader.read())
+    with phase("aggregate"):
+        return (count_overlaps(axis_aligned(segments)), count_overlaps(segments))
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == (5, 12)
+
+
+@selftest
+def test_count_overlaps():
+    segments = parse(EXAMPLE)
+    far = segments + [10 ** 9, 0, 10 ** 9, 0]
+    assert count_overlaps(np.concatenate([segments, far])) == 24
+    assert count_overlaps(parse("1,1 -> 1,1\n1,1 -> 1,1")) == 1
+    assert count_overlaps(parse("")) == 0
+    assert count_overlaps(segments * 10 ** 7) == LineIndex(segments * 10 ** 7).overlaps()
+
+
+@selftest
+def test_line_index():
+    segments = parse(EXAMPLE)
+    assert LineIndex(axis_aligned(segments)).overlaps() == 5
+    assert LineIndex(segments).overlaps() == 12
+    assert LineIndex(segments + [10 ** 12, -10 ** 9, 10 ** 12, -10 ** 9]).overlaps() == 12
+    star = parse("0,2 -> 4,2\n2,0 -> 2,4\n0,0 -> 4,4\n0,4 -> 4,0\n1,2 -> 3,2\n1,1 -> 3,3")
+    assert LineIndex(star).overlaps() == count_overlaps(star)
+
+
+@selftest
+def test_danger_index():
+    segments = parse(EXAMPLE)
+    index = DangerIndex.build(segments)
+    assert index.count(0, 0, 9, 9) == 12
+    assert index.count(9, 9, 0, 0) == 12
+    assert index.count(-100, -100, 100, 100) == 12
+    assert index.count(0, 4, 9, 4) == 4
+    assert index.count(7, 4, 7, 4) == 1
+    assert index.count(20, 20, 30, 30) == 0
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "danger.npz"
+        index.save(path)
+        loaded = DangerIndex.load(path)
+    assert np.array_equal(loaded.table, index.table)
+    assert loaded.count(2, 0, 9, 5) == index.count(2, 0, 9, 5)
+    try:
+        DangerIndex.build(segments * 10 ** 4)
+        assert False
+    except ValueError:
+        pass
+
+
+def main():
+    with open("input/day05.txt") as file:
+        (aligned, all) = solve(file)
+        print(f"There are {aligned} points of overlap")
+        print(f"There are {all} points of overlap with diagonals")
+
+
+if __name__ == "__main__":
+    main()
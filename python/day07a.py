@@ -1,17 +1,25 @@
 from collections import deque
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """16,1,2,0,4,2,7,1,2,14"""
 
 
 def solve(input: str) -> int:
-    submarines = list(map(int, input.split(",")))
-    submarines.sort()
-    n = len(submarines)
-    median = submarines[n // 2]
-    return sum(abs(submarine - median) for submarine in submarines)
-
-
-assert solve(EXAMPLE) == 37
+    with phase("parse"):
+        submarines = list(map(int, input.split(",")))
+    with phase("search"):
+        submarines.sort()
+        n = len(submarines)
+        median = submarines[n // 2]
+    with phase("aggregate"):
+        return sum(abs(submarine - median) for submarine in submarines)
+
+
+@selftest
+def test_solve():
+    assert solve(EXAMPLE) == 37
 
 
 def main():
@@ -1,5 +1,8 @@
 from collections import deque
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """16,1,2,0,4,2,7,1,2,14"""
 
 
@@ -10,24 +13,28 @@ def solve(input: str) -> int:
     def fuel(position, submarines):
         return sum(dist_fuel(abs(submarine - position)) for submarine in submarines)
 
-    submarines = list(map(int, input.split(",")))
-    n = len(submarines)
-    average = sum(submarines) // n
-    min_fuel = fuel(average, submarines)
-    offset = 0
-    offset_fuel = min_fuel
-    while offset_fuel <= min_fuel:
-        offset += 1
-        offset_fuel = min(
-            fuel(average - offset, submarines),
-            fuel(average + offset, submarines),
-        )
-        min_fuel = min(min_fuel, offset_fuel)
+    with phase("parse"):
+        submarines = list(map(int, input.split(",")))
+    with phase("search"):
+        n = len(submarines)
+        average = sum(submarines) // n
+        min_fuel = fuel(average, submarines)
+        offset = 0
+        offset_fuel = min_fuel
+        while offset_fuel <= min_fuel:
+            offset += 1
+            offset_fuel = min(
+                fuel(average - offset, submarines),
+                fuel(average + offset, submarines),
+            )
+            min_fuel = min(min_fuel, offset_fuel)
 
     return min_fuel
 
 
-assert solve(EXAMPLE) == 168
+@selftest
+def test_solve():
+    assert solve(EXAMPLE) == 168
 
 
 def main():
@@ -1,5 +1,8 @@
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
 fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
@@ -13,16 +16,20 @@ gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce
 
 
 def solve(reader: io.TextIOBase) -> int:
-    result = 0
-    for line in reader.readlines():
-        words = line.strip().split()
-        for word in words[11:]:
-            if len(word) in {2, 3, 4, 7}:
-                result += 1
+    with phase("parse"):
+        outputs = [line.strip().split()[11:] for line in reader.readlines()]
+    with phase("aggregate"):
+        result = 0
+        for words in outputs:
+            for word in words:
+                if len(word) in {2, 3, 4, 7}:
+                    result += 1
     return result
 
 
-assert solve(io.StringIO(EXAMPLE)) == 26
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 26
 
 
 def main():
@@ -2,6 +2,9 @@ from functools import reduce
 import io
 from typing import Callable
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
 fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
@@ -46,15 +49,19 @@ def parse(digits: list[str], table: list[str]) -> int:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    result = 0
-    for line in reader.readlines():
-        words = list(map(normalize, line.strip().split()))
-        table = deduce_table(words[:10])
-        result += parse(words[11:], table)
+    with phase("parse"):
+        entries = [list(map(normalize, line.strip().split())) for line in reader.readlines()]
+    with phase("search"):
+        result = 0
+        for words in entries:
+            table = deduce_table(words[:10])
+            result += parse(words[11:], table)
     return result
 
 
-assert solve(io.StringIO(EXAMPLE)) == 61229
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 61229
 
 
 def main():
@@ -1,5 +1,11 @@
 import io
 
+import numpy as np
+
+import grid
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """2199943210
 3987894921
 9856789892
@@ -8,25 +14,19 @@ EXAMPLE = """2199943210
 
 
 def solve(reader: io.TextIOBase) -> int:
-    matrix: list[list[int]] = []
-    for line in reader.readlines():
-        matrix.append(list(map(int, line.strip())))
-    m = len(matrix)
-    n = len(matrix[0])
-    result = 0
-    for (i, row) in enumerate(matrix):
-        for (j, cell) in enumerate(row):
-            is_low_point = all(
-                cell < matrix[i + di][j + dj]
-                for (di, dj) in [(-1, 0), (0, -1), (0, 1), (1, 0)]
-                if 0 <= i + di < m and 0 <= j + dj < n
-            )
-            if is_low_point:
-                result += cell + 1
-    return result
-
-
-assert solve(io.StringIO(EXAMPLE)) == 15
+    with phase("parse"):
+        heights = grid.parse_digits(reader.read())
+    with phase("search"):
+        is_low_point = np.ones(heights.shape, dtype=bool)
+        for neighbor in grid.shifts(heights, grid.NEIGHBORS4, 10):
+            is_low_point &= heights < neighbor
+    with phase("aggregate"):
+        return int(heights[is_low_point].sum(dtype=np.int64) + np.count_nonzero(is_low_point))
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 15
 
 
 def main():
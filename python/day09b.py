@@ -1,5 +1,10 @@
 import io
-from typing import Iterator
+
+import numpy as np
+
+import grid
+from phases import phase
+from selftest import selftest
 
 EXAMPLE = """2199943210
 3987894921
@@ -7,48 +12,45 @@ EXAMPLE = """2199943210
 8767896789
 9899965678"""
 
-Coord = tuple[int, int]
-
 
 def solve(reader: io.TextIOBase) -> int:
-    matrix: list[list[int]] = []
-    for line in reader.readlines():
-        matrix.append(list(map(int, line.strip())))
-    m = len(matrix)
-    n = len(matrix[0])
-
-    def neighbors(coord: Coord) -> Iterator[Coord]:
-        (i0, j0) = coord
-        if matrix[i0][j0] == 9:
-            return
-        for (di, dj) in [(-1, 0), (0, -1), (0, 1), (1, 0)]:
-            (i, j) = (i0 + di, j0 + dj)
-            if 0 <= i < m and 0 <= j < n and matrix[i][j] != 9:
-                yield (i, j)
-
-    seen = set()
-
-    def dfs(coord) -> None:
-        if coord in seen:
-            return
-        seen.add(coord)
-        for neighbor in neighbors(coord):
-            dfs(neighbor)
-
-    basin_sizes = []
-    for i in range(m):
-        for j in range(n):
-            coord = (i, j)
-            if matrix[i][j] != 9 and coord not in seen:
-                seen_size = len(seen)
-                dfs(coord)
-                basin_sizes.append(len(seen) - seen_size)
-    basin_sizes.sort(reverse=True)
-    [size0, size1, size2] = basin_sizes[:3]
-    return size0 * size1 * size2
-
-
-assert solve(io.StringIO(EXAMPLE)) == 1134
+    with phase("parse"):
+        heights = grid.parse_digits(reader.read())
+    with phase("build"):
+        in_basin = heights != 9
+        cells = np.arange(heights.size).reshape(heights.shape)
+        horizontal = in_basin[:, :-1] & in_basin[:, 1:]
+        vertical = in_basin[:-1, :] & in_basin[1:, :]
+        lhs = np.concatenate([cells[:, :-1][horizontal], cells[:-1, :][vertical]])
+        rhs = np.concatenate([cells[:, 1:][horizontal], cells[1:, :][vertical]])
+    with phase("search"):
+        # Union-find over all edges at once: hook the larger root of every edge
+        # onto the smaller one, then compress all paths, until no edge connects
+        # two different roots.
+        parents = cells.ravel().copy()
+        while True:
+            (lhs_roots, rhs_roots) = (parents[lhs], parents[rhs])
+            distinct = lhs_roots != rhs_roots
+            if not distinct.any():
+                break
+            (lhs_roots, rhs_roots) = (lhs_roots[distinct], rhs_roots[distinct])
+            np.minimum.at(
+                parents,
+                np.maximum(lhs_roots, rhs_roots),
+                np.minimum(lhs_roots, rhs_roots),
+            )
+            while not np.array_equal(grandparents := parents[parents], parents):
+                parents = grandparents
+    with phase("aggregate"):
+        (_, basin_sizes) = np.unique(parents[in_basin.ravel()], return_counts=True)
+        basin_sizes.sort()
+        [size2, size1, size0] = basin_sizes[-3:].tolist()
+        return size0 * size1 * size2
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 1134
 
 
 def main():
@@ -1,5 +1,8 @@
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """[({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
 {([(<{}[<>[]}>{[]{[(<()>
@@ -40,13 +43,18 @@ def error_score(line: str) -> int:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    total_score = 0
-    for line in reader.readlines():
-        total_score += error_score(line.strip())
+    with phase("parse"):
+        lines = [line.strip() for line in reader.readlines()]
+    with phase("aggregate"):
+        total_score = 0
+        for line in lines:
+            total_score += error_score(line)
     return total_score
 
 
-assert solve(io.StringIO(EXAMPLE)) == 26397
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 26397
 
 
 def main():
@@ -1,6 +1,9 @@
 import io
 from typing import Optional
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """[({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
 {([(<{}[<>[]}>{[]{[(<()>
@@ -44,16 +47,21 @@ def completion_score(line: str) -> Optional[int]:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    scores = []
-    for line in reader.readlines():
-        score = completion_score(line.strip())
-        if score is not None:
-            scores.append(score)
-    scores.sort()
-    return scores[len(scores) // 2]
+    with phase("parse"):
+        lines = [line.strip() for line in reader.readlines()]
+    with phase("aggregate"):
+        scores = []
+        for line in lines:
+            score = completion_score(line)
+            if score is not None:
+                scores.append(score)
+        scores.sort()
+        return scores[len(scores) // 2]
 
 
-assert solve(io.StringIO(EXAMPLE)) == 288957
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 288957
 
 
 def main():
@@ -1,6 +1,11 @@
-from collections import deque
 import io
 
+import numpy as np
+
+import grid
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """5483143223
 2745854711
 5264556173
@@ -13,45 +18,29 @@ EXAMPLE = """5483143223
 5283751526"""
 
 
-Coord = tuple[int, int]
-
-
-def step(matrix: list[list[int]]) -> bool:
-    m = len(matrix)
-    n = len(matrix)
-
-    def neighbors(coord: Coord) -> list[Coord]:
-        (i0, j0) = coord
-        return [
-            (i, j) for di in [-1, 0, 1] for dj in [-1, 0, 1]
-            if (di != 0 or dj != 0) and 0 <= (i := i0 + di) < m and 0 <= (j := j0 + dj) < n
-        ]
-
-    flashed = set()
-    queue = deque((i, j) for i in range(m) for j in range(n))
-    while len(queue) > 0:
-        coord = queue.popleft()
-        (i, j) = coord
-        matrix[i][j] += 1
-        if matrix[i][j] > 9 and coord not in flashed:
-            flashed.add(coord)
-            queue.extend(neighbors(coord))
-    for (i, j) in flashed:
-        matrix[i][j] = 0
-    return len(flashed) == m * n
+def step(energies: grid.Grid) -> bool:
+    energies += 1
+    flashed = np.zeros(energies.shape, dtype=bool)
+    while (flashing := (energies > 9) & ~flashed).any():
+        flashed |= flashing
+        energies += grid.count_neighbors(flashing)
+    energies[flashed] = 0
+    return bool(flashed.all())
 
 
 def solve(reader: io.TextIOBase) -> int:
-    matrix = []
-    for line in reader.readlines():
-        matrix.append(list(map(int, line.strip())))
-    num_steps = 1
-    while not step(matrix):
-        num_steps += 1
+    with phase("parse"):
+        energies = grid.parse_digits(reader.read())
+    with phase("search"):
+        num_steps = 1
+        while not step(energies):
+            num_steps += 1
     return num_steps
 
 
-assert solve(io.StringIO(EXAMPLE)) == 195
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 195
 
 
 def main():
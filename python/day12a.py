@@ -1,6 +1,9 @@
 from collections import defaultdict
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE1 = """start-A
 start-b
 A-c
@@ -54,18 +57,22 @@ def dfs(graph: Graph, v: str, seen: frozenset[int]):
 
 
 def solve(reader: io.TextIOBase) -> int:
-    graph: Graph = defaultdict(list)
-    for line in reader.readlines():
-        [u, v] = line.strip().split("-")
-        graph[u].append(v)
-        graph[v].append(u)
-
-    return dfs(graph, "start", frozenset())
-
-
-assert solve(io.StringIO(EXAMPLE1)) == 10
-assert solve(io.StringIO(EXAMPLE2)) == 19
-assert solve(io.StringIO(EXAMPLE3)) == 226
+    with phase("parse"):
+        graph: Graph = defaultdict(list)
+        for line in reader.readlines():
+            [u, v] = line.strip().split("-")
+            graph[u].append(v)
+            graph[v].append(u)
+
+    with phase("search"):
+        return dfs(graph, "start", frozenset())
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE1)) == 10
+    assert solve(io.StringIO(EXAMPLE2)) == 19
+    assert solve(io.StringIO(EXAMPLE3)) == 226
 
 
 def main():
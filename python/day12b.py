@@ -1,6 +1,9 @@
 from collections import defaultdict
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE1 = """start-A
 start-b
 A-c
@@ -56,18 +59,22 @@ def dfs(graph: Graph, v: str, seen: frozenset[int], joker: bool):
 
 
 def solve(reader: io.TextIOBase) -> int:
-    graph: Graph = defaultdict(list)
-    for line in reader.readlines():
-        [u, v] = line.strip().split("-")
-        graph[u].append(v)
-        graph[v].append(u)
-
-    return dfs(graph, "start", frozenset(), True)
-
-
-assert solve(io.StringIO(EXAMPLE1)) == 36
-assert solve(io.StringIO(EXAMPLE2)) == 103
-assert solve(io.StringIO(EXAMPLE3)) == 3509
+    with phase("parse"):
+        graph: Graph = defaultdict(list)
+        for line in reader.readlines():
+            [u, v] = line.strip().split("-")
+            graph[u].append(v)
+            graph[v].append(u)
+
+    with phase("search"):
+        return dfs(graph, "start", frozenset(), True)
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE1)) == 36
+    assert solve(io.StringIO(EXAMPLE2)) == 103
+    assert solve(io.StringIO(EXAMPLE3)) == 3509
 
 
 def main():
@@ -1,5 +1,8 @@
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """6,10
 0,14
 9,10
@@ -37,19 +40,23 @@ def fold_dot(dot: Dot, axis: str, offset: int) -> set[Dot]:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    dots = set()
-    while (line := reader.readline().strip()) != "":
-        [x, y] = line.split(",")
-        dots.add((int(x), int(y)))
-    line = reader.readline().strip()
-    [_, _, fold] = line.split()
-    [axis, offset] = fold.split("=")
-    offset = int(offset)
-    dots_after_fold = {fold_dot(dot, axis, offset) for dot in dots}
-    return len(dots_after_fold)
-
-
-assert solve(io.StringIO(EXAMPLE)) == 17
+    with phase("parse"):
+        dots = set()
+        while (line := reader.readline().strip()) != "":
+            [x, y] = line.split(",")
+            dots.add((int(x), int(y)))
+        line = reader.readline().strip()
+        [_, _, fold] = line.split()
+        [axis, offset] = fold.split("=")
+        offset = int(offset)
+    with phase("aggregate"):
+        dots_after_fold = {fold_dot(dot, axis, offset) for dot in dots}
+        return len(dots_after_fold)
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 17
 
 
 def main():
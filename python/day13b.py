@@ -1,5 +1,8 @@
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """6,10
 0,14
 9,10
@@ -51,20 +54,26 @@ def imagine(dots: set[Dot]) -> str:
 
 
 def solve(reader: io.TextIOBase) -> str:
-    dots = set()
-    while (line := reader.readline().strip()) != "":
-        [x, y] = line.split(",")
-        dots.add((int(x), int(y)))
-    for line in reader.readlines():
-        [_, _, fold] = line.strip().split()
-        [axis, offset] = fold.split("=")
-        offset = int(offset)
-        dots = {fold_dot(dot, axis, offset) for dot in dots}
-
-    return imagine(dots)
-
-
-assert solve(io.StringIO(EXAMPLE)) == EXAMPLE_IMAGE
+    with phase("parse"):
+        dots = set()
+        while (line := reader.readline().strip()) != "":
+            [x, y] = line.split(",")
+            dots.add((int(x), int(y)))
+        folds = []
+        for line in reader.readlines():
+            [_, _, fold] = line.strip().split()
+            [axis, offset] = fold.split("=")
+            folds.append((axis, int(offset)))
+
+    with phase("aggregate"):
+        for (axis, offset) in folds:
+            dots = {fold_dot(dot, axis, offset) for dot in dots}
+        return imagine(dots)
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == EXAMPLE_IMAGE
 
 
 def main():
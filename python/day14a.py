@@ -2,6 +2,9 @@ from collections import Counter
 from itertools import chain
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """NNCB
 
 CH -> B
@@ -33,19 +36,24 @@ def step(polymer: str, rules: dict[str, str]) -> str:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    template = reader.readline().strip()
-    reader.readline()
-    rules = {line[:2]: line[6] for line in reader.readlines()}
+    with phase("parse"):
+        template = reader.readline().strip()
+        reader.readline()
+        rules = {line[:2]: line[6] for line in reader.readlines()}
 
-    polymer = template
-    for _ in range(10):
-        polymer = step(polymer, rules)
+    with phase("build"):
+        polymer = template
+        for _ in range(10):
+            polymer = step(polymer, rules)
 
-    counter = Counter(polymer)
-    return max(counter.values()) - min(counter.values())
+    with phase("aggregate"):
+        counter = Counter(polymer)
+        return max(counter.values()) - min(counter.values())
 
 
-assert solve(io.StringIO(EXAMPLE)) == 1588
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 1588
 
 
 def main():
@@ -1,6 +1,9 @@
 from collections import Counter
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """NNCB
 
 CH -> B
@@ -54,22 +57,27 @@ class Polymer:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    template = reader.readline().strip()
-    reader.readline()
-    rules = {
-        line[:2]: (line[0] + line[6], line[6] + line[1])
-        for line in reader.readlines()
-    }
-
-    polymer = Polymer(template)
-    for _ in range(40):
-        polymer.step(rules)
-
-    counter = polymer.counts()
-    return max(counter.values()) - min(counter.values())
-
-
-assert solve(io.StringIO(EXAMPLE)) == 2188189693529
+    with phase("parse"):
+        template = reader.readline().strip()
+        reader.readline()
+        rules = {
+            line[:2]: (line[0] + line[6], line[6] + line[1])
+            for line in reader.readlines()
+        }
+
+    with phase("build"):
+        polymer = Polymer(template)
+        for _ in range(40):
+            polymer.step(rules)
+
+    with phase("aggregate"):
+        counter = polymer.counts()
+        return max(counter.values()) - min(counter.values())
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 2188189693529
 
 
 def main():
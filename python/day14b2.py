@@ -2,6 +2,9 @@ from collections import Counter
 from functools import cache
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """NNCB
 
 CH -> B
@@ -23,9 +26,10 @@ CN -> C"""
 
 
 def solve(reader: io.TextIOBase) -> int:
-    template = reader.readline().strip()
-    reader.readline()
-    rules = {line[:2]: line[6] for line in reader.readlines()}
+    with phase("parse"):
+        template = reader.readline().strip()
+        reader.readline()
+        rules = {line[:2]: line[6] for line in reader.readlines()}
 
     @cache
     def counts(pair: str, steps: int) -> Counter[str]:
@@ -37,14 +41,17 @@ def solve(reader: io.TextIOBase) -> int:
                 + counts(pair[0] + inner, steps - 1) \
                 + counts(inner + pair[1], steps - 1)
 
-    counter = sum(
-        (counts(template[i:i+2], 40) for i in range(len(template) - 1)),
-        start=Counter(template),
-    )
-    return max(counter.values()) - min(counter.values())
+    with phase("aggregate"):
+        counter = sum(
+            (counts(template[i:i+2], 40) for i in range(len(template) - 1)),
+            start=Counter(template),
+        )
+        return max(counter.values()) - min(counter.values())
 
 
-assert solve(io.StringIO(EXAMPLE)) == 2188189693529
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 2188189693529
 
 
 def main():
@@ -0,0 +1,69 @@
+from collections.abc import Iterator
+import io
+
+import numpy as np
+
+import grid
+from phases import phase
+import search
+from selftest import selftest
+
+EXAMPLE = """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+
+
+def lowest_risk(risks: grid.Grid) -> int:
+    # Cells of the padded grid are addressed by flat index and the zero border
+    # stops the search, so neighbors need no bounds checks.
+    with phase("build"):
+        (m, n) = risks.shape
+        width = n + 2
+        cells = grid.pad(risks, 0).ravel().tolist()
+        offsets = [-width, -1, 1, width]
+
+    def neighbors(node: int) -> Iterator[tuple[int, int]]:
+        for offset in offsets:
+            risk = cells[node + offset]
+            if risk > 0:
+                yield (node + offset, risk)
+
+    with phase("search"):
+        return search.bucket_dijkstra(width + 1, neighbors, m * width + n, max_weight=9)
+
+
+def tile(risks: grid.Grid) -> grid.Grid:
+    (m, n) = risks.shape
+    tiles = np.add.outer(np.repeat(np.arange(5), m), np.repeat(np.arange(5), n))
+    return (np.tile(risks, (5, 5)) + tiles - 1) % 9 + 1
+
+
+def solve(reader: io.TextIOBase) -> tuple[int, int]:
+    with phase("parse"):
+        risks = grid.parse_digits(reader.read())
+    with phase("build"):
+        tiled = tile(risks)
+    return (lowest_risk(risks), lowest_risk(tiled))
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == (40, 315)
+
+
+def main():
+    with open("input/day15.txt") as file:
+        (small, large) = solve(file)
+        print(f"The lowest total risk is {small}")
+        print(f"The lowest total risk in the full cave is {large}")
+
+
+if __name__ == "__main__":
+    main()
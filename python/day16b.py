@@ -3,6 +3,9 @@ from collections.abc import Iterator
 from dataclasses import dataclass
 from math import prod
 
+from phases import phase
+from selftest import selftest
+
 
 class limit(Iterator):
     items: Iterator
@@ -26,14 +29,16 @@ class limit(Iterator):
             raise StopIteration
 
 
-test_iter = iter(range(0, 6))
-assert list(limit(test_iter, 3)) == [0, 1, 2]
-assert list(test_iter) == [3, 4, 5]
-try:
-    list(limit(iter([0, 1]), 4))
-    assert False
-except ValueError:
-    pass
+@selftest
+def test_limit():
+    test_iter = iter(range(0, 6))
+    assert list(limit(test_iter, 3)) == [0, 1, 2]
+    assert list(test_iter) == [3, 4, 5]
+    try:
+        list(limit(iter([0, 1]), 4))
+        assert False
+    except ValueError:
+        pass
 
 
 def hex_bits(chars: str) -> Iterator[bool]:
@@ -43,8 +48,10 @@ def hex_bits(chars: str) -> Iterator[bool]:
             yield digit & mask != 0
 
 
-assert list(hex_bits("8B")) == \
-    [True, False, False, False, True, False, True, True]
+@selftest
+def test_hex_bits():
+    assert list(hex_bits("8B")) == \
+        [True, False, False, False, True, False, True, True]
 
 
 def take_int(bits: Iterator[bool], width: int) -> int:
@@ -56,14 +63,16 @@ def take_int(bits: Iterator[bool], width: int) -> int:
     return result
 
 
-test_iter = iter([True, False, True, True, False])
-assert take_int(test_iter, 3) == 5
-assert list(test_iter) == [True, False]
-try:
-    take_int(iter([True, False]), 5)
-    assert False
-except ValueError:
-    pass
+@selftest
+def test_take_int():
+    test_iter = iter([True, False, True, True, False])
+    assert take_int(test_iter, 3) == 5
+    assert list(test_iter) == [True, False]
+    try:
+        take_int(iter([True, False]), 5)
+        assert False
+    except ValueError:
+        pass
 
 
 @dataclass(frozen=True)
@@ -110,15 +119,17 @@ class Operator(Packet):
                 raise ValueError(f"invalid packet type: {self.type}")
 
 
-literal = Literal(3, 4, 5)
-assert literal.version == 3
-assert literal.type == 4
-assert literal.value == 5
+@selftest
+def test_packet():
+    literal = Literal(3, 4, 5)
+    assert literal.version == 3
+    assert literal.type == 4
+    assert literal.value == 5
 
-operator = Operator(4, 3, [literal])
-assert operator.version == 4
-assert operator.type == 3
-assert operator.operands == [literal]
+    operator = Operator(4, 3, [literal])
+    assert operator.version == 4
+    assert operator.type == 3
+    assert operator.operands == [literal]
 
 
 TYPE_LITERAL = 4
@@ -134,8 +145,10 @@ def decode_int(bits: Iterator[bool]) -> int:
     return result
 
 
-encode_0x8B = [True, True, False, False, False, False, True, False, True, True]
-assert decode_int(iter(encode_0x8B)) == 0x8B
+@selftest
+def test_decode_int():
+    encode_0x8B = [True, True, False, False, False, False, True, False, True, True]
+    assert decode_int(iter(encode_0x8B)) == 0x8B
 
 
 def decode_bits(bits: Iterator[bool]) -> Packet:
@@ -162,30 +175,37 @@ def decode(chars: str) -> Packet:
     return decode_bits(hex_bits(chars))
 
 
-assert decode("D2FE28") == Literal(version=6, type=4, value=2021)
-assert decode("38006F45291200") == Operator(version=1, type=6, operands=(
-    Literal(version=6, type=4, value=10),
-    Literal(version=2, type=4, value=20),
-))
-assert decode("EE00D40C823060") == Operator(version=7, type=3, operands=(
-    Literal(version=2, type=4, value=1),
-    Literal(version=4, type=4, value=2),
-    Literal(version=1, type=4, value=3),
-))
+@selftest
+def test_decode():
+    assert decode("D2FE28") == Literal(version=6, type=4, value=2021)
+    assert decode("38006F45291200") == Operator(version=1, type=6, operands=(
+        Literal(version=6, type=4, value=10),
+        Literal(version=2, type=4, value=20),
+    ))
+    assert decode("EE00D40C823060") == Operator(version=7, type=3, operands=(
+        Literal(version=2, type=4, value=1),
+        Literal(version=4, type=4, value=2),
+        Literal(version=1, type=4, value=3),
+    ))
 
 
 def solve(chars: str) -> int:
-    return decode(chars).eval()
-
-
-assert solve("C200B40A82") == 3
-assert solve("04005AC33890") == 54
-assert solve("880086C3E88112") == 7
-assert solve("CE00C43D881120") == 9
-assert solve("D8005AC2A8F0") == 1
-assert solve("F600BC2D8F") == 0
-assert solve("9C005AC2F8F0") == 0
-assert solve("9C0141080250320F1802104A08") == 1
+    with phase("parse"):
+        packet = decode(chars)
+    with phase("aggregate"):
+        return packet.eval()
+
+
+@selftest
+def test_solve():
+    assert solve("C200B40A82") == 3
+    assert solve("04005AC33890") == 54
+    assert solve("880086C3E88112") == 7
+    assert solve("CE00C43D881120") == 9
+    assert solve("D8005AC2A8F0") == 1
+    assert solve("F600BC2D8F") == 0
+    assert solve("9C005AC2F8F0") == 0
+    assert solve("9C0141080250320F1802104A08") == 1
 
 
 def main():
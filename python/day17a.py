@@ -1,5 +1,7 @@
 from math import sqrt, floor, ceil
 
+from selftest import selftest
+
 
 def solve(x_min: int, x_max: int, y_min: int, y_max: int) -> int:
     if ceil(sqrt(2 * x_min + 0.25) - 0.5) <= floor(sqrt(2 * x_max + 0.25) - 0.5):
@@ -8,11 +10,16 @@ def solve(x_min: int, x_max: int, y_min: int, y_max: int) -> int:
         raise Exception("more complex solution required")
 
 
-assert solve(20, 30, -10, -5) == 45
+@selftest
+def test_solve():
+    assert solve(20, 30, -10, -5) == 45
+
+
+INPUT = (257, 286, -101, -57)
 
 
 def main():
-    result = solve(257, 286, -101, -57)
+    result = solve(*INPUT)
     print(f"The packet evaluates to {result}")
 
 
@@ -1,8 +1,12 @@
 from ast import literal_eval
 from dataclasses import dataclass
+from functools import reduce
 import io
 from typing import Any
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE1 = """[1,1]
 [2,2]
 [3,3]
@@ -108,21 +112,23 @@ def explode(number: Number) -> bool:
     return go(Cell([number], 0), 0, None, None)
 
 
-def test_explode(before: Number, after: Number):
+def check_explode(before: Number, after: Number):
     assert explode(before) and before == after
 
 
-test_explode([[[[[9, 8], 1], 2], 3], 4], [[[[0, 9], 2], 3], 4])
-test_explode([7, [6, [5, [4, [3, 2]]]]], [7, [6, [5, [7, 0]]]])
-test_explode([[6, [5, [4, [3, 2]]]], 1], [[6, [5, [7, 0]]], 3])
-test_explode(
-    [[3, [2, [1, [7, 3]]]], [6, [5, [4, [3, 2]]]]],
-    [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
-)
-test_explode(
-    [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
-    [[3, [2, [8, 0]]], [9, [5, [7, 0]]]],
-)
+@selftest
+def test_explode():
+    check_explode([[[[[9, 8], 1], 2], 3], 4], [[[[0, 9], 2], 3], 4])
+    check_explode([7, [6, [5, [4, [3, 2]]]]], [7, [6, [5, [7, 0]]]])
+    check_explode([[6, [5, [4, [3, 2]]]], 1], [[6, [5, [7, 0]]], 3])
+    check_explode(
+        [[3, [2, [1, [7, 3]]]], [6, [5, [4, [3, 2]]]]],
+        [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
+    )
+    check_explode(
+        [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
+        [[3, [2, [8, 0]]], [9, [5, [7, 0]]]],
+    )
 
 
 def split(number: Number) -> bool:
@@ -151,22 +157,26 @@ def add(lhs: Number, rhs: Number) -> Number:
     return res
 
 
-assert add([[[[4, 3], 4], 4], [7, [[8, 4], 9]]], [1, 1]) == \
-    [[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]
+@selftest
+def test_add():
+    assert add([[[[4, 3], 4], 4], [7, [[8, 4], 9]]], [1, 1]) == \
+        [[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]
 
 
 def add_file(reader: io.TextIOBase) -> Number:
-    result = literal_eval(reader.readline())
-    for line in reader.readlines():
-        result = add(result, literal_eval(line))
-    return result
+    with phase("parse"):
+        numbers = [literal_eval(line) for line in reader.readlines()]
+    with phase("build"):
+        return reduce(add, numbers)
 
 
-assert add_file(io.StringIO(EXAMPLE1)) == RESULT1
-assert add_file(io.StringIO(EXAMPLE2)) == RESULT2
-assert add_file(io.StringIO(EXAMPLE3)) == RESULT3
-assert add_file(io.StringIO(EXAMPLE4)) == RESULT4
-assert add_file(io.StringIO(EXAMPLE5)) == RESULT5
+@selftest
+def test_add_file():
+    assert add_file(io.StringIO(EXAMPLE1)) == RESULT1
+    assert add_file(io.StringIO(EXAMPLE2)) == RESULT2
+    assert add_file(io.StringIO(EXAMPLE3)) == RESULT3
+    assert add_file(io.StringIO(EXAMPLE4)) == RESULT4
+    assert add_file(io.StringIO(EXAMPLE5)) == RESULT5
 
 
 def magnitude(number: Number) -> int:
@@ -177,20 +187,26 @@ def magnitude(number: Number) -> int:
         return 3 * magnitude(left) + 2 * magnitude(right)
 
 
-assert magnitude([[1, 2], [[3, 4], 5]]) == 143
-assert magnitude([[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]) == 1384
-assert magnitude([[[[1, 1], [2, 2]], [3, 3]], [4, 4]]) == 445
-assert magnitude([[[[3, 0], [5, 3]], [4, 4]], [5, 5]]) == 791
-assert magnitude([[[[5, 0], [7, 4]], [5, 5]], [6, 6]]) == 1137
-assert magnitude([[[[8, 7], [7, 7]], [[8, 6], [7, 7]]], [[[0, 7], [6, 6]], [8, 7]]]) == \
-    3488
+@selftest
+def test_magnitude():
+    assert magnitude([[1, 2], [[3, 4], 5]]) == 143
+    assert magnitude([[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]) == 1384
+    assert magnitude([[[[1, 1], [2, 2]], [3, 3]], [4, 4]]) == 445
+    assert magnitude([[[[3, 0], [5, 3]], [4, 4]], [5, 5]]) == 791
+    assert magnitude([[[[5, 0], [7, 4]], [5, 5]], [6, 6]]) == 1137
+    assert magnitude([[[[8, 7], [7, 7]], [[8, 6], [7, 7]]], [[[0, 7], [6, 6]], [8, 7]]]) == \
+        3488
 
 
 def solve(reader: io.TextIOBase) -> int:
-    return magnitude(add_file(reader))
+    number = add_file(reader)
+    with phase("aggregate"):
+        return magnitude(number)
 
 
-assert solve(io.StringIO(EXAMPLE5)) == 4140
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE5)) == 4140
 
 
 def main():
@@ -3,6 +3,9 @@ from dataclasses import dataclass
 import io
 from typing import Any
 
+from phases import phase
+from selftest import selftest
+
 
 EXAMPLE = """[[[0,[5,8]],[[1,7],[9,6]]],[[4,[1,2]],[[1,4],2]]]
 [[[5,[2,8]],4],[5,[[9,9],0]]]
@@ -74,21 +77,23 @@ def explode(number: Number) -> bool:
     return go(Cell([number], 0), 0, None, None)
 
 
-def test_explode(before: Number, after: Number):
+def check_explode(before: Number, after: Number):
     assert explode(before) and before == after
 
 
-test_explode([[[[[9, 8], 1], 2], 3], 4], [[[[0, 9], 2], 3], 4])
-test_explode([7, [6, [5, [4, [3, 2]]]]], [7, [6, [5, [7, 0]]]])
-test_explode([[6, [5, [4, [3, 2]]]], 1], [[6, [5, [7, 0]]], 3])
-test_explode(
-    [[3, [2, [1, [7, 3]]]], [6, [5, [4, [3, 2]]]]],
-    [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
-)
-test_explode(
-    [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
-    [[3, [2, [8, 0]]], [9, [5, [7, 0]]]],
-)
+@selftest
+def test_explode():
+    check_explode([[[[[9, 8], 1], 2], 3], 4], [[[[0, 9], 2], 3], 4])
+    check_explode([7, [6, [5, [4, [3, 2]]]]], [7, [6, [5, [7, 0]]]])
+    check_explode([[6, [5, [4, [3, 2]]]], 1], [[6, [5, [7, 0]]], 3])
+    check_explode(
+        [[3, [2, [1, [7, 3]]]], [6, [5, [4, [3, 2]]]]],
+        [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
+    )
+    check_explode(
+        [[3, [2, [8, 0]]], [9, [5, [4, [3, 2]]]]],
+        [[3, [2, [8, 0]]], [9, [5, [7, 0]]]],
+    )
 
 
 def split(number: Number) -> bool:
@@ -117,12 +122,14 @@ def add(lhs: Number, rhs: Number) -> Number:
     return res
 
 
-assert add([[[[4, 3], 4], 4], [7, [[8, 4], 9]]], [1, 1]) == \
-    [[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]
-assert add(
-    [[2, [[7, 7], 7]], [[5, 8], [[9, 3], [0, 2]]]],
-    [[[0, [5, 8]], [[1, 7], [9, 6]]], [[4, [1, 2]], [[1, 4], 2]]]
-) == [[[[7, 8], [6, 6]], [[6, 0], [7, 7]]], [[[7, 8], [8, 8]], [[7, 9], [0, 6]]]]
+@selftest
+def test_add():
+    assert add([[[[4, 3], 4], 4], [7, [[8, 4], 9]]], [1, 1]) == \
+        [[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]
+    assert add(
+        [[2, [[7, 7], 7]], [[5, 8], [[9, 3], [0, 2]]]],
+        [[[0, [5, 8]], [[1, 7], [9, 6]]], [[4, [1, 2]], [[1, 4], 2]]]
+    ) == [[[[7, 8], [6, 6]], [[6, 0], [7, 7]]], [[[7, 8], [8, 8]], [[7, 9], [0, 6]]]]
 
 
 def magnitude(number: Number) -> int:
@@ -133,28 +140,34 @@ def magnitude(number: Number) -> int:
         return 3 * magnitude(left) + 2 * magnitude(right)
 
 
-assert magnitude([[1, 2], [[3, 4], 5]]) == 143
-assert magnitude([[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]) == 1384
-assert magnitude([[[[1, 1], [2, 2]], [3, 3]], [4, 4]]) == 445
-assert magnitude([[[[3, 0], [5, 3]], [4, 4]], [5, 5]]) == 791
-assert magnitude([[[[5, 0], [7, 4]], [5, 5]], [6, 6]]) == 1137
-assert magnitude([[[[8, 7], [7, 7]], [[8, 6], [7, 7]]], [[[0, 7], [6, 6]], [8, 7]]]) == \
-    3488
-assert magnitude([[[[7, 8], [6, 6]], [[6, 0], [7, 7]]], [[[7, 8], [8, 8]], [[7, 9], [0, 6]]]]) == \
-    3993
+@selftest
+def test_magnitude():
+    assert magnitude([[1, 2], [[3, 4], 5]]) == 143
+    assert magnitude([[[[0, 7], 4], [[7, 8], [6, 0]]], [8, 1]]) == 1384
+    assert magnitude([[[[1, 1], [2, 2]], [3, 3]], [4, 4]]) == 445
+    assert magnitude([[[[3, 0], [5, 3]], [4, 4]], [5, 5]]) == 791
+    assert magnitude([[[[5, 0], [7, 4]], [5, 5]], [6, 6]]) == 1137
+    assert magnitude([[[[8, 7], [7, 7]], [[8, 6], [7, 7]]], [[[0, 7], [6, 6]], [8, 7]]]) == \
+        3488
+    assert magnitude([[[[7, 8], [6, 6]], [[6, 0], [7, 7]]], [[[7, 8], [8, 8]], [[7, 9], [0, 6]]]]) == \
+        3993
 
 
 def solve(reader: io.TextIOBase) -> int:
-    numbers = [line for line in reader.readlines()]
-    return max(
-        magnitude(add(literal_eval(m), literal_eval(n)))
-        for (i, m) in enumerate(numbers)
-        for (j, n) in enumerate(numbers)
-        if i != j
-    )
-
-
-assert solve(io.StringIO(EXAMPLE)) == 3993
+    with phase("parse"):
+        numbers = [line for line in reader.readlines()]
+    with phase("aggregate"):
+        return max(
+            magnitude(add(literal_eval(m), literal_eval(n)))
+            for (i, m) in enumerate(numbers)
+            for (j, n) in enumerate(numbers)
+            if i != j
+        )
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 3993
 
 
 def main():
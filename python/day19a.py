@@ -5,6 +5,9 @@ from itertools import permutations, product
 import numpy as np
 import numpy.linalg as la
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """--- scanner 0 ---
 404,-588,-901
 528,-643,409
@@ -158,7 +161,11 @@ def compute_rotations() -> list[Rotation]:
 
 
 ROTATIONS: list[Rotation] = compute_rotations()
-assert len(ROTATIONS) == 24
+
+
+@selftest
+def test_rotations():
+    assert len(ROTATIONS) == 24
 
 
 Coord = np.ndarray
@@ -217,22 +224,29 @@ def match_list(scanners: list[Scanner]) -> None:
     assert len(rest) == 0
 
 
-scanners = parse_input(io.StringIO(EXAMPLE))
-match_list(scanners)
+@selftest
+def test_match_list():
+    scanners = parse_input(io.StringIO(EXAMPLE))
+    match_list(scanners)
 
 
 def solve(reader: io.TextIOBase) -> int:
-    scanners = parse_input(reader)
-    match_list(scanners)
-    beacons = {
-        tuple(scanner.position + beacon)
-        for scanner in scanners
-        for beacon in scanner.beacons
-    }
+    with phase("parse"):
+        scanners = parse_input(reader)
+    with phase("search"):
+        match_list(scanners)
+    with phase("aggregate"):
+        beacons = {
+            tuple(scanner.position + beacon)
+            for scanner in scanners
+            for beacon in scanner.beacons
+        }
     return len(beacons)
 
 
-assert solve(io.StringIO(EXAMPLE)) == 79
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 79
 
 
 def main():
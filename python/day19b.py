@@ -5,6 +5,9 @@ from itertools import permutations, product
 import numpy as np
 import numpy.linalg as la
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """--- scanner 0 ---
 404,-588,-901
 528,-643,409
@@ -158,7 +161,11 @@ def compute_rotations() -> list[Rotation]:
 
 
 ROTATIONS: list[Rotation] = compute_rotations()
-assert len(ROTATIONS) == 24
+
+
+@selftest
+def test_rotations():
+    assert len(ROTATIONS) == 24
 
 
 Coord = np.ndarray
@@ -217,20 +224,27 @@ def match_list(scanners: list[Scanner]) -> None:
     assert len(rest) == 0
 
 
-scanners = parse_input(io.StringIO(EXAMPLE))
-match_list(scanners)
-
-
-def solve(reader: io.TextIOBase) -> int:
-    scanners = parse_input(reader)
+@selftest
+def test_match_list():
+    scanners = parse_input(io.StringIO(EXAMPLE))
     match_list(scanners)
-    return max(
-        int(sum(abs(scanner1.position - scanner2.position)))
-        for (scanner1, scanner2) in product(scanners, repeat=2)
-    )
 
 
-assert solve(io.StringIO(EXAMPLE)) == 3621
+def solve(reader: io.TextIOBase) -> int:
+    with phase("parse"):
+        scanners = parse_input(reader)
+    with phase("search"):
+        match_list(scanners)
+    with phase("aggregate"):
+        return max(
+            int(sum(abs(scanner1.position - scanner2.position)))
+            for (scanner1, scanner2) in product(scanners, repeat=2)
+        )
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 3621
 
 
 def main():
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
 import io
 
+import numpy as np
+
+import grid
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """..#.#..#####.#.#.#.###.##.....###.##.#..###.####..#####..#....#..#..##..###..######.###...####..#..#####..##..#.#####...##.#.#..#.##..#.#......#.###.######.###.####...#.##.##..#..#..#####.....#.#....###..#.##......#.....#..#..#..##..#...##.######.####.####.#.#...#.......#..#.#.#...####.##.#......#..#...##.#.##..#...##.#.##..###.#......#.#.......#.#.#.####.###.##...#.....####.#..#..#.##.#....##..#.####....##...##..#...#......#.#.......#.......##..####..#...#.#.#...##..#.#..###..#####........#..####......#..#
 
 #..#.
@@ -12,49 +18,37 @@ EXAMPLE = """..#.#..#####.#.#.#.###.##.....###.##.#..###.####..#####..#....#..#.
 
 @dataclass
 class Image:
-    inner: list[str]
-    outer: str
-
-
-def enhance(algorithm: str, image: Image) -> Image:
-    m = len(image.inner)
-    n = len(image.inner[0])
-
-    def pixel(i: int, j: int) -> str:
-        index = 0
-        for di in [-1, 0, 1]:
-            for dj in [-1, 0, 1]:
-                index *= 2
-                if 0 <= i + di < m and 0 <= j + dj < n:
-                    if image.inner[i + di][j + dj] == "#":
-                        index += 1
-                else:
-                    if image.outer == "#":
-                        index += 1
-        return algorithm[index]
-
-    inner = [
-        "".join(pixel(i, j) for j in range(-1, n + 1))
-        for i in range(-1, m + 1)
-    ]
-    outer = algorithm[0] if image.outer == "." else algorithm[511]
+    inner: grid.Grid
+    outer: bool
+
+
+def enhance(algorithm: grid.Grid, image: Image) -> Image:
+    base = grid.pad(image.inner, image.outer)
+    index = np.zeros(base.shape, dtype=np.uint16)
+    for neighbor in grid.shifts(base, grid.WINDOW9, image.outer):
+        index <<= 1
+        index |= neighbor
+    inner = algorithm[index]
+    outer = bool(algorithm[511 if image.outer else 0])
     return Image(inner=inner, outer=outer)
 
 
 def solve(reader: io.TextIOBase) -> int:
-    algorithm = reader.readline().strip()
-    reader.readline()
-    image = Image(
-        inner=[line.strip() for line in reader.readlines()],
-        outer=".",
-    )
-    for _ in range(50):
-        image = enhance(algorithm, image)
-    assert image.outer == "."
-    return sum(line.count("#") for line in image.inner)
-
-
-assert solve(io.StringIO(EXAMPLE)) == 3351
+    with phase("parse"):
+        [algorithm] = grid.parse(reader.readline()) == ord("#")
+        reader.readline()
+        image = Image(inner=grid.parse(reader.read()) == ord("#"), outer=False)
+    with phase("build"):
+        for _ in range(50):
+            image = enhance(algorithm, image)
+        assert not image.outer
+    with phase("aggregate"):
+        return int(np.count_nonzero(image.inner))
+
+
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 3351
 
 
 def main():
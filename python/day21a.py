@@ -1,3 +1,7 @@
+from phases import phase
+from selftest import selftest
+
+
 def solve(player1: int, player2: int) -> int:
     next_roll = 1
     num_rolls = 0
@@ -14,22 +18,27 @@ def solve(player1: int, player2: int) -> int:
     scores = [0, 0]
     player = 0
 
-    while scores[0] < 1000 and scores[1] < 1000:
-        locations[player] = \
-            (locations[player] + roll() + roll() + roll() - 1) % 10 + 1
-        scores[player] += locations[player]
-        player = 1 - player
+    with phase("aggregate"):
+        while scores[0] < 1000 and scores[1] < 1000:
+            locations[player] = \
+                (locations[player] + roll() + roll() + roll() - 1) % 10 + 1
+            scores[player] += locations[player]
+            player = 1 - player
 
     return num_rolls * scores[player]
 
 
-assert solve(4, 8) == 739785
+@selftest
+def test_solve():
+    assert solve(4, 8) == 739785
+
+
+INPUT = (3, 10)
 
 
 def main():
-    with open("input/day20.txt") as file:
-        result = solve(3, 10)
-        print(f"The product is {result}")
+    result = solve(*INPUT)
+    print(f"The product is {result}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 from functools import cache
 
+from phases import phase
+from selftest import selftest
+
 ROLLS = [
     (3, 1),
     (4, 3),
@@ -24,16 +27,21 @@ def solve(player1: int, player2: int) -> int:
             wins2 += freq * sub_wins2
         return (wins1, wins2)
 
-    return max(go(player1, player2, 0, 0))
+    with phase("search"):
+        return max(go(player1, player2, 0, 0))
+
+
+@selftest
+def test_solve():
+    assert solve(4, 8) == 444356092776315
 
 
-assert solve(4, 8) == 444356092776315
+INPUT = (3, 10)
 
 
 def main():
-    with open("input/day20.txt") as file:
-        result = solve(3, 10)
-        print(f"The product is {result}")
+    result = solve(*INPUT)
+    print(f"The product is {result}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE1 = """on x=10..12,y=10..12,z=10..12
 on x=11..13,y=11..13,z=11..13
 off x=9..11,y=9..11,z=9..11
@@ -30,28 +33,37 @@ on x=967..23432,y=45373..81175,z=27513..53682"""
 
 
 def solve(reader: io.TextIOBase) -> int:
-    reactor = \
-        [[[False for _ in range(101)] for _ in range(101)] for _ in range(101)]
+    with phase("parse"):
+        steps = []
+        for line in reader.readlines():
+            [onoff_str, coords] = line.strip().split()
+            onoff = onoff_str == "on"
+            [(x_min, x_max), (y_min, y_max), (z_min, z_max)] = [
+                tuple(map(int, coord[2:].split("..")))
+                for coord in coords.split(",")
+            ]
+            steps.append((onoff, x_min, x_max, y_min, y_max, z_min, z_max))
+
+    with phase("build"):
+        reactor = \
+            [[[False for _ in range(101)] for _ in range(101)] for _ in range(101)]
 
-    for line in reader.readlines():
-        [onoff_str, coords] = line.strip().split()
-        onoff = onoff_str == "on"
-        [(x_min, x_max), (y_min, y_max), (z_min, z_max)] = [
-            tuple(map(int, coord[2:].split("..")))
-            for coord in coords.split(",")
-        ]
-        for x in range(max(x_min, -50) + 50, min(x_max, 50) + 51):
-            for y in range(max(y_min, -50) + 50, min(y_max, 50) + 51):
-                for z in range(max(z_min, -50) + 50, min(z_max, 50) + 51):
-                    reactor[x][y][z] = onoff
+        for (onoff, x_min, x_max, y_min, y_max, z_min, z_max) in steps:
+            for x in range(max(x_min, -50) + 50, min(x_max, 50) + 51):
+                for y in range(max(y_min, -50) + 50, min(y_max, 50) + 51):
+                    for z in range(max(z_min, -50) + 50, min(z_max, 50) + 51):
+                        reactor[x][y][z] = onoff
 
-    return sum(
-        1 for matrix in reactor for row in matrix for cell in row if cell
-    )
+    with phase("aggregate"):
+        return sum(
+            1 for matrix in reactor for row in matrix for cell in row if cell
+        )
 
 
-assert solve(io.StringIO(EXAMPLE1)) == 39
-assert solve(io.StringIO(EXAMPLE2)) == 590784
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE1)) == 39
+    assert solve(io.StringIO(EXAMPLE2)) == 590784
 
 
 def main():
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 import io
 
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """on x=-5..47,y=-31..22,z=-19..33
 on x=-44..5,y=-27..21,z=-14..35
 on x=-49..-1,y=-11..42,z=-10..38
@@ -93,35 +96,40 @@ class Command:
 
 
 def solve(reader: io.TextIOBase) -> int:
-    commands = [Command.parse(line.strip()) for line in reader.readlines()]
-    xs = sorted(x for cmd in commands for x in [cmd.x_min, cmd.x_max])
-    ys = sorted(y for cmd in commands for y in [cmd.y_min, cmd.y_max])
-    zs = sorted(z for cmd in commands for z in [cmd.z_min, cmd.z_max])
-    for cmd in commands:
-        cmd.cluster(xs, ys, zs)
-
-    reactor = [[[False for _ in zs] for _ in ys] for _ in zs]
-
-    for cmd in commands:
-        for x in range(cmd.x_min, cmd.x_max):
-            for y in range(cmd.y_min, cmd.y_max):
-                for z in range(cmd.z_min, cmd.z_max):
-                    reactor[x][y][z] = cmd.onoff
-
-    result = 0
-    for x in range(len(xs) - 1):
-        x_delta = xs[x + 1] - xs[x]
-        for y in range(len(ys) - 1):
-            y_delta = ys[y + 1] - ys[y]
-            for z in range(len(zs) - 1):
-                z_delta = zs[z + 1] - zs[z]
-                if reactor[x][y][z]:
-                    result += x_delta * y_delta * z_delta
+    with phase("parse"):
+        commands = [Command.parse(line.strip()) for line in reader.readlines()]
+    with phase("build"):
+        xs = sorted(x for cmd in commands for x in [cmd.x_min, cmd.x_max])
+        ys = sorted(y for cmd in commands for y in [cmd.y_min, cmd.y_max])
+        zs = sorted(z for cmd in commands for z in [cmd.z_min, cmd.z_max])
+        for cmd in commands:
+            cmd.cluster(xs, ys, zs)
+
+        reactor = [[[False for _ in zs] for _ in ys] for _ in zs]
+
+        for cmd in commands:
+            for x in range(cmd.x_min, cmd.x_max):
+                for y in range(cmd.y_min, cmd.y_max):
+                    for z in range(cmd.z_min, cmd.z_max):
+                        reactor[x][y][z] = cmd.onoff
+
+    with phase("aggregate"):
+        result = 0
+        for x in range(len(xs) - 1):
+            x_delta = xs[x + 1] - xs[x]
+            for y in range(len(ys) - 1):
+                y_delta = ys[y + 1] - ys[y]
+                for z in range(len(zs) - 1):
+                    z_delta = zs[z + 1] - zs[z]
+                    if reactor[x][y][z]:
+                        result += x_delta * y_delta * z_delta
 
     return result
 
 
-assert solve(io.StringIO(EXAMPLE)) == 2758514936282235
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 2758514936282235
 
 
 def main():
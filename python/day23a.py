@@ -1,32 +1,9 @@
 from dataclasses import dataclass, replace
-from heapq import heappush, heappop
-import math
-from typing import Callable, ClassVar, Generator, Iterator
-
-
-def dijkstra(
-    source: str,
-    neighbors: Callable[[str], Iterator[tuple[str, int]]],
-    target: str,
-) -> int:
-    distances = {source: 0}
-    queue = [(0, source)]
-
-    while len(queue) > 0:
-        (node_dist, node) = heappop(queue)
-        if node_dist > distances[node]:
-            continue
-        if node == target:
-            return node_dist
-
-        for (neighbor, edge_dist) in neighbors(node):
-            neighbor_dist = node_dist + edge_dist
-            if neighbor not in distances or neighbor_dist < distances[neighbor]:
-                distances[neighbor] = neighbor_dist
-                heappush(queue, (neighbor_dist, neighbor))
-
-    return math.inf
+from typing import ClassVar, Generator
 
+from phases import phase
+import search
+from selftest import selftest
 
 CAVE_DEPTH = 2
 CAVE_COLS = {"A": 2, "B": 4, "C": 6, "D": 8}
@@ -87,20 +64,22 @@ Coord.ALL = [Coord(0, col) for col in range(11)] + [
     for col in CAVE_COLS.values()
 ]
 
-assert len(Coord.ALL) == 11 + 4 * CAVE_DEPTH
 
+@selftest
+def test_coord():
+    assert len(Coord.ALL) == 11 + 4 * CAVE_DEPTH
 
-assert Coord(0, 0).index() == 0
-assert Coord(0, 10).index() == 10
-assert Coord(1, 2).index() == 11
-assert Coord(CAVE_DEPTH, 2).index() == 10 + CAVE_DEPTH
-assert Coord(1, 8).index() == 11 + 3 * CAVE_DEPTH
-assert Coord(CAVE_DEPTH, 8).index() == 10 + 4 * CAVE_DEPTH
+    assert Coord(0, 0).index() == 0
+    assert Coord(0, 10).index() == 10
+    assert Coord(1, 2).index() == 11
+    assert Coord(CAVE_DEPTH, 2).index() == 10 + CAVE_DEPTH
+    assert Coord(1, 8).index() == 11 + 3 * CAVE_DEPTH
+    assert Coord(CAVE_DEPTH, 8).index() == 10 + 4 * CAVE_DEPTH
 
-assert list(Coord(0, 0).path_to(Coord(2, 2))) == \
-    [Coord(0, 1), Coord(0, 2), Coord(1, 2), Coord(2, 2)]
-assert list(Coord(2, 4).path_to(Coord(0, 7))) == \
-    [Coord(1, 4), Coord(0, 4), Coord(0, 5), Coord(0, 6), Coord(0, 7)]
+    assert list(Coord(0, 0).path_to(Coord(2, 2))) == \
+        [Coord(0, 1), Coord(0, 2), Coord(1, 2), Coord(2, 2)]
+    assert list(Coord(2, 4).path_to(Coord(0, 7))) == \
+        [Coord(1, 4), Coord(0, 4), Coord(0, 5), Coord(0, 6), Coord(0, 7)]
 
 
 @dataclass(frozen=True, order=True)
@@ -131,6 +110,16 @@ class State:
     def path_clear(self, start: Coord, finish: Coord) -> bool:
         return all(self[coord] in ".x" for coord in start.path_to(finish))
 
+    def lower_bound(self) -> int:
+        # Every amphipod outside of its cave still has to walk to the
+        # entrance of that cave, which makes this a consistent heuristic.
+        total = 0
+        for coord in Coord.ALL:
+            kind = self[coord]
+            if kind in CAVE_COLS and coord.col != CAVE_COLS[kind]:
+                total += COST[kind] * (coord.row + abs(coord.col - CAVE_COLS[kind]) + 1)
+        return total
+
     def moves(self) -> Generator:
         for start_col in CAVE_COLS.values():
             start = Coord(row=1, col=start_col)
@@ -172,59 +161,68 @@ class State:
 
 State.FINISH = State.make([CAVE_DEPTH * kind for kind in "ABCD"])
 
-assert State.FINISH.data == "..x.x.x.x..AABBCCDD"
+
+@selftest
+def test_finish():
+    assert State.FINISH.data == "..x.x.x.x..AABBCCDD"
+
 
 EXAMPLE = State.make(["BA", "CD", "BC", "DA"])
 
-assert EXAMPLE.data == "..x.x.x.x..BACDBCDA"
-
-assert EXAMPLE[Coord(0, 0)] == "."
-assert EXAMPLE[Coord(0, 2)] == "x"
-assert EXAMPLE[Coord(0, 10)] == "."
-assert EXAMPLE[Coord(1, 2)] == "B"
-assert EXAMPLE[Coord(CAVE_DEPTH, 2)] == "A"
-assert EXAMPLE[Coord(1, 8)] == "D"
-assert EXAMPLE[Coord(CAVE_DEPTH, 8)] == "A"
-
-assert EXAMPLE.move(Coord(1, 2), Coord(0, 3)).data == "..xBx.x.x...ACDBCDA"
-assert EXAMPLE.\
-    move(Coord(1, 2), Coord(0, 3)).\
-    move(Coord(1, 4), Coord(1, 2)).\
-    move(Coord(0, 3), Coord(1, 3)) == State.make(["CA", "BD", "BC", "DA"])
-
-assert EXAMPLE.path_clear(Coord(1, 2), Coord(0, 3))
-assert EXAMPLE.\
-    move(Coord(1, 2), Coord(0, 3)).\
-    path_clear(Coord(0, 3), Coord(1, 2))
-assert not EXAMPLE.\
-    move(Coord(1, 2), Coord(0, 3)).\
-    path_clear(Coord(1, 4), Coord(0, 1))
-assert len(list(EXAMPLE.moves())) == 28
-assert len(list(EXAMPLE.move(Coord(1, 2), Coord(0, 3)).moves())) == 12
-assert len(list(EXAMPLE.move(Coord(1, 4), Coord(0, 3)).moves())) == 14
-
-EXAMPLE2 = \
-    EXAMPLE.move(Coord(1, 6), Coord(0, 7)).move(Coord(1, 4), Coord(0, 5))
-assert (EXAMPLE2.move(Coord(0, 5), Coord(1, 6)), 200) in list(EXAMPLE2.moves())
-EXAMPLE3 = \
-    EXAMPLE.move(Coord(1, 4), Coord(0, 3)).move(Coord(1, 6), Coord(0, 5))
-assert \
-    (EXAMPLE3.move(Coord(0, 5), Coord(1, 4)), 20) not in list(EXAMPLE3.moves())
+
+@selftest
+def test_state():
+    assert EXAMPLE.data == "..x.x.x.x..BACDBCDA"
+
+    assert EXAMPLE[Coord(0, 0)] == "."
+    assert EXAMPLE[Coord(0, 2)] == "x"
+    assert EXAMPLE[Coord(0, 10)] == "."
+    assert EXAMPLE[Coord(1, 2)] == "B"
+    assert EXAMPLE[Coord(CAVE_DEPTH, 2)] == "A"
+    assert EXAMPLE[Coord(1, 8)] == "D"
+    assert EXAMPLE[Coord(CAVE_DEPTH, 8)] == "A"
+
+    assert EXAMPLE.move(Coord(1, 2), Coord(0, 3)).data == "..xBx.x.x...ACDBCDA"
+    assert EXAMPLE.\
+        move(Coord(1, 2), Coord(0, 3)).\
+        move(Coord(1, 4), Coord(1, 2)).\
+        move(Coord(0, 3), Coord(1, 3)) == State.make(["CA", "BD", "BC", "DA"])
+
+    assert EXAMPLE.path_clear(Coord(1, 2), Coord(0, 3))
+    assert EXAMPLE.\
+        move(Coord(1, 2), Coord(0, 3)).\
+        path_clear(Coord(0, 3), Coord(1, 2))
+    assert not EXAMPLE.\
+        move(Coord(1, 2), Coord(0, 3)).\
+        path_clear(Coord(1, 4), Coord(0, 1))
+    assert len(list(EXAMPLE.moves())) == 28
+    assert len(list(EXAMPLE.move(Coord(1, 2), Coord(0, 3)).moves())) == 12
+    assert len(list(EXAMPLE.move(Coord(1, 4), Coord(0, 3)).moves())) == 14
+
+    EXAMPLE2 = \
+        EXAMPLE.move(Coord(1, 6), Coord(0, 7)).move(Coord(1, 4), Coord(0, 5))
+    assert (EXAMPLE2.move(Coord(0, 5), Coord(1, 6)), 200) in list(EXAMPLE2.moves())
+    EXAMPLE3 = \
+        EXAMPLE.move(Coord(1, 4), Coord(0, 3)).move(Coord(1, 6), Coord(0, 5))
+    assert \
+        (EXAMPLE3.move(Coord(0, 5), Coord(1, 4)), 20) not in list(EXAMPLE3.moves())
 
 
 def solve(source: State) -> int:
-    return dijkstra(
-        source,
-        lambda state: state.moves(),
-        State.FINISH,
-    )
+    with phase("search"):
+        return search.astar(source, State.moves, State.FINISH, State.lower_bound)
+
+
+@selftest
+def test_solve():
+    assert solve(EXAMPLE) == 12521
 
 
-assert solve(EXAMPLE) == 12521
+INPUT = (State.make(["CB", "AA", "DB", "DC"]),)
 
 
 def main():
-    result = solve(State.make(["CB", "AA", "DB", "DC"]))
+    result = solve(*INPUT)
     print(f"The amphipods required {result} energy")
 
 
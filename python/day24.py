@@ -1,7 +1,11 @@
 from enum import Enum
 from functools import reduce
+import io
 import math
 
+from phases import phase
+from selftest import selftest
+
 
 LIMIT = 200
 
@@ -118,8 +122,10 @@ class Num(Exp):
         return str(self.value)
 
 
-assert Num(0) is Num(0)
-assert len(Num.instances) == 1 and Num.instances[0] is Num(0)
+@selftest
+def test_num():
+    assert Num(0) is Num(0)
+    assert len(Num.instances) == 1 and Num.instances[0] is Num(0)
 
 
 class Op(Enum):
@@ -230,6 +236,7 @@ def clauses(exp):
 
 class Machine:
     def __init__(self):
+        Inp.count = 0
         self.registers = {name: Num(0) for name in "wxyz"}
 
     def run(self, line):
@@ -251,31 +258,41 @@ class Machine:
             self.registers[reg] = exp.simplify()
 
 
+def solve(reader: io.TextIOBase) -> tuple[int, int]:
+    with phase("parse"):
+        program = [line.strip() for line in reader.readlines()]
+    with phase("build"):
+        machine = Machine()
+        for line in program:
+            machine.run(line)
+    with phase("search"):
+        exp = machine.registers["z"]
+        [clause] = list(clauses(exp))
+        digits_a = 14 * [9]
+        digits_b = 14 * [1]
+        for constraint in clause:
+            match constraint:
+                case Equal(Bin(Op.ADD, Inp(i), Num(n)), Inp(j)):
+                    if n >= 0:
+                        digits_a[i] = 9 - n
+                        digits_b[j] = 1 + n
+                    else:
+                        digits_a[j] = 9 + n
+                        digits_b[i] = 1 - n
+                case Equal(Inp(i), Inp(j)):
+                    pass
+                case _: assert False
+    with phase("aggregate"):
+        result_a = reduce(lambda a, b: 10 * a + b, digits_a, 0)
+        result_b = reduce(lambda a, b: 10 * a + b, digits_b, 0)
+    return (result_a, result_b)
+
+
 def main():
-    machine = Machine()
     with open("input/day24.txt") as file:
-        for line in file.readlines():
-            machine.run(line.strip())
-    exp = machine.registers["z"]
-    [clause] = list(clauses(exp))
-    digits_a = 14 * [9]
-    digits_b = 14 * [1]
-    for constraint in clause:
-        match constraint:
-            case Equal(Bin(Op.ADD, Inp(i), Num(n)), Inp(j)):
-                if n >= 0:
-                    digits_a[i] = 9 - n
-                    digits_b[j] = 1 + n
-                else:
-                    digits_a[j] = 9 + n
-                    digits_b[i] = 1 - n
-            case Equal(Inp(i), Inp(j)):
-                pass
-            case _: assert False
-    result_a = reduce(lambda a, b: 10 * a + b, digits_a, 0)
-    result_b = reduce(lambda a, b: 10 * a + b, digits_b, 0)
-    print(f"The biggest model number is {result_a}")
-    print(f"The smallest model number is {result_b}")
+        (result_a, result_b) = solve(file)
+        print(f"The biggest model number is {result_a}")
+        print(f"The smallest model number is {result_b}")
 
 
 if __name__ == "__main__":
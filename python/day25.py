@@ -1,5 +1,9 @@
 import io
 
+import grid
+from phases import phase
+from selftest import selftest
+
 EXAMPLE = """v...>>.vv>
 .vv>>.vv..
 >>.>v>...v
@@ -11,39 +15,34 @@ v.v..>>v.v
 ....v..v.>"""
 
 
-def step(map: list[list[str]]) -> bool:
-    m = len(map)
-    n = len(map[0])
-    move_east = set()
-    for i in range(m):
-        for j in range(n):
-            if map[i][j] == ">" and map[i][(j + 1) % n] == ".":
-                move_east.add((i, j))
-    for (i, j) in move_east:
-        map[i][j] = "."
-        map[i][(j + 1) % n] = ">"
-    move_south = set()
-    for i in range(m):
-        for j in range(n):
-            if map[i][j] == "v" and map[(i + 1) % m][j] == ".":
-                move_south.add((i, j))
-    for (i, j) in move_south:
-        map[i][j] = "."
-        map[(i + 1) % m][j] = "v"
-    return len(move_east) > 0 or len(move_south) > 0
+EMPTY = ord(".")
+EAST = ord(">")
+SOUTH = ord("v")
+
+
+def step(herds: grid.Grid) -> bool:
+    move_east = (herds == EAST) & (grid.wrap(herds, 0, 1) == EMPTY)
+    herds[move_east] = EMPTY
+    herds[grid.wrap(move_east, 0, -1)] = EAST
+    move_south = (herds == SOUTH) & (grid.wrap(herds, 1, 0) == EMPTY)
+    herds[move_south] = EMPTY
+    herds[grid.wrap(move_south, -1, 0)] = SOUTH
+    return bool(move_east.any() or move_south.any())
 
 
 def solve(reader: io.TextIOBase) -> int:
-    map = []
-    for line in reader.readlines():
-        map.append(list(line.strip()))
-    result = 1
-    while step(map):
-        result += 1
+    with phase("parse"):
+        herds = grid.parse(reader.read())
+    with phase("search"):
+        result = 1
+        while step(herds):
+            result += 1
     return result
 
 
-assert solve(io.StringIO(EXAMPLE)) == 58
+@selftest
+def test_solve():
+    assert solve(io.StringIO(EXAMPLE)) == 58
 
 
 def main():
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+import importlib
+import inspect
+import io
+from pathlib import Path
+import re
+from types import ModuleType
+from typing import Any
+
+PYTHON_DIR = Path(__file__).resolve().parent
+INPUT_DIR = PYTHON_DIR.parent / "input"
+
+NAME_PATTERN = re.compile(r"day(\d\d)[a-z0-9]*")
+
+# Either the text of an input file or the positional arguments of `solve`.
+Input = str | tuple
+
+
+def names() -> list[str]:
+    return sorted(
+        path.stem for path in PYTHON_DIR.glob("day*.py")
+        if NAME_PATTERN.fullmatch(path.stem)
+    )
+
+
+def select(patterns: list[str]) -> list[str]:
+    all_names = names()
+    if not patterns:
+        return all_names
+    selected = [
+        name for name in all_names
+        if any(name.startswith(pattern) for pattern in patterns)
+    ]
+    if not selected:
+        raise ValueError(f"no day matches {' '.join(patterns)}")
+    return selected
+
+
+def input_path(number: int) -> Path:
+    return INPUT_DIR / f"day{number:02}.txt"
+
+
+@dataclass
+class Day:
+    name: str
+    module: ModuleType
+
+    @staticmethod
+    def load(name: str):
+        if not NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"{name} is not a day module")
+        return Day(name=name, module=importlib.import_module(name))
+
+    @property
+    def number(self) -> int:
+        return int(NAME_PATTERN.fullmatch(self.name).group(1))
+
+    def read_input(self) -> Input:
+        if hasattr(self.module, "INPUT"):
+            return self.module.INPUT
+        return input_path(self.number).read_text()
+
+    def arguments(self, input: Input) -> tuple:
+        if isinstance(input, tuple):
+            return input
+        [param, *_] = inspect.signature(self.module.solve).parameters.values()
+        if param.annotation is str:
+            return (input,)
+        return (io.StringIO(input),)
+
+    def solve(self, input: Input) -> Any:
+        return self.module.solve(*self.arguments(input))
@@ -0,0 +1,492 @@
+import argparse
+from collections.abc import Callable
+import itertools
+import random
+import sys
+
+from days import NAME_PATTERN, Day, Input
+
+Generator = Callable[[int, random.Random], Input]
+
+GENERATORS: dict[str, Generator] = {}
+
+
+def generator(name: str) -> Callable[[Generator], Generator]:
+    def register(gen: Generator) -> Generator:
+        GENERATORS[name] = gen
+        return gen
+    return register
+
+
+def find(name: str) -> Generator | None:
+    match = NAME_PATTERN.fullmatch(name)
+    if match is None:
+        raise ValueError(f"{name} is not a day module")
+    return GENERATORS.get(name) or GENERATORS.get(f"day{match.group(1)}")
+
+
+def generate(name: str, size: int, seed: int = 0) -> Input:
+    gen = find(name)
+    if gen is None:
+        raise ValueError(f"there is no input generator for {name}")
+    return gen(size, random.Random(f"{name[:5]}:{size}:{seed}"))
+
+
+def lines(items) -> str:
+    return "".join(f"{item}\n" for item in items)
+
+
+@generator("day01")
+def gen_day01(size: int, rng: random.Random) -> Input:
+    depths = []
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+    return lines(depths)
+
+
+@generator("day02")
+def gen_day02(size: int, rng: random.Random) -> Input:
+    commands = rng.choices(["forward", "down", "up"], weights=[2, 2, 1], k=size)
+    return lines(f"{command} {rng.randint(1, 9)}" for command in commands)
+
+
+@generator("day03")
+def gen_day03(size: int, rng: random.Random) -> Input:
+    # Every prefix shared by more than one number is followed by both a 0 and
+    # a 1, so the life support filters of day03b never run out of numbers.
+    width = max(12, size.bit_length() + 1)
+    numbers = []
+
+    def build(prefix: str, count: int) -> None:
+        rest = width - len(prefix)
+        if count == 1:
+            numbers.append(prefix + "".join(rng.choices("01", k=rest)))
+            return
+        capacity = 1 << (rest - 1)
+        zeros = rng.randint(max(1, count - capacity), min(count - 1, capacity))
+        build(prefix + "0", zeros)
+        build(prefix + "1", count - zeros)
+
+    build("", max(size, 2))
+    rng.shuffle(numbers)
+    return lines(numbers)
+
+
+@generator("day04")
+def gen_day04(size: int, rng: random.Random) -> Input:
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    boards = []
+    for _ in range(size):
+        cells = rng.sample(range(100), 25)
+        boards.append(lines(
+            " ".join(f"{cell:2}" for cell in cells[5 * i:5 * i + 5])
+            for i in range(5)
+        ))
+    return ",".join(map(str, numbers)) + "\n\n" + "\n".join(boards)
+
+
+@generator("day05")
+def gen_day05(size: int, rng: random.Random) -> Input:
+    segments = []
+    for _ in range(size):
+        (x1, y1) = (rng.randrange(1000), rng.randrange(1000))
+        length = rng.randint(1, 300)
+        (dx, dy) = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        (x2, y2) = (x1 + dx * length, y1 + dy * length)
+        if not (0 <= x2 < 1000 and 0 <= y2 < 1000):
+            (x2, y2) = (x1 - dx * length, y1 - dy * length)
+        if not (0 <= x2 < 1000 and 0 <= y2 < 1000):
+            (x2, y2) = (x1, y1 + 1 if y1 < 999 else y1 - 1)
+        segments.append(f"{x1},{y1} -> {x2},{y2}")
+    return lines(segments)
+
+
+@generator("day06")
+def gen_day06(size: int, rng: random.Random) -> Input:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+@generator("day07")
+def gen_day07(size: int, rng: random.Random) -> Input:
+    return ",".join(str(int(rng.expovariate(1 / 400)) % 2000) for _ in range(size)) + "\n"
+
+
+DIGIT_SEGMENTS = [
+    "abcefg", "cf", "acdeg", "acdfg", "bcdf",
+    "abdfg", "abdefg", "acf", "abcdefg", "abcdfg",
+]
+
+
+@generator("day08")
+def gen_day08(size: int, rng: random.Random) -> Input:
+    entries = []
+    for _ in range(size):
+        wires = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def wire(digit: int) -> str:
+            pattern = [wires[segment] for segment in DIGIT_SEGMENTS[digit]]
+            rng.shuffle(pattern)
+            return "".join(pattern)
+
+        patterns = [wire(digit) for digit in rng.sample(range(10), 10)]
+        outputs = [wire(rng.randrange(10)) for _ in range(4)]
+        entries.append(f"{' '.join(patterns)} | {' '.join(outputs)}")
+    return lines(entries)
+
+
+def digit_grid(size: int, rng: random.Random, digit: Callable[[], int]) -> Input:
+    return lines(
+        "".join(str(digit()) for _ in range(size)) for _ in range(size)
+    )
+
+
+@generator("day09")
+def gen_day09(size: int, rng: random.Random) -> Input:
+    # Walls of 9s below the percolation threshold keep basins small.
+    return digit_grid(
+        max(size, 3), rng,
+        lambda: 9 if rng.random() < 0.45 else rng.randint(0, 8),
+    )
+
+
+@generator("day10")
+def gen_day10(size: int, rng: random.Random) -> Input:
+    pairs = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    chunks = []
+    for index in range(max(size, 1)):
+        (line, stack) = ([], [])
+        while len(line) < 100 or not stack:
+            if stack and rng.random() < 0.45:
+                line.append(pairs[stack.pop()])
+            else:
+                opening = rng.choice("([{<")
+                stack.append(opening)
+                line.append(opening)
+        if index % 2 == 1:
+            wrong = [char for char in ")]}>" if char != pairs[stack[-1]]]
+            line.append(rng.choice(wrong))
+        chunks.append("".join(line))
+    return lines(chunks)
+
+
+@generator("day11")
+def gen_day11(size: int, rng: random.Random) -> Input:
+    # Random grids often never synchronize, which would make day11b loop
+    # forever. Mostly uniform grids synchronize within a few dozen steps.
+    base = rng.randint(0, 9)
+    return digit_grid(
+        max(size, 1), rng,
+        lambda: rng.randint(0, 9) if rng.random() < 0.1 else base,
+    )
+
+
+@generator("day12")
+def gen_day12(size: int, rng: random.Random) -> Input:
+    # Big caves are never adjacent to each other, otherwise there would be
+    # infinitely many paths. The number of paths grows very quickly with size.
+    small = [f"s{i}" for i in range(max(size, 2))]
+    big = [f"B{i}" for i in range(max(size // 3, 1))]
+    edges = {("start", rng.choice(small)), (rng.choice(small), "end")}
+    for cave in big:
+        for other in rng.sample(small, min(3, len(small))):
+            edges.add((cave, other))
+    for (cave, other) in zip(small, small[1:]):
+        if rng.random() < 0.5:
+            edges.add((cave, other))
+        else:
+            edges.add((rng.choice(big), other))
+    return lines(f"{u}-{v}" for (u, v) in sorted(edges))
+
+
+@generator("day13")
+def gen_day13(size: int, rng: random.Random) -> Input:
+    (width, height) = (1311, 895)
+    x_folds = []
+    while width > 40:
+        width //= 2
+        x_folds.append(width)
+    y_folds = []
+    while height > 6:
+        height //= 2
+        y_folds.append(height)
+    dots = set()
+    while len(dots) < min(size, 1311 * 895 // 2):
+        (x, y) = (rng.randrange(1311), rng.randrange(895))
+        if x != x_folds[0] and y != y_folds[0]:
+            dots.add((x, y))
+    folds = [
+        f"fold along {axis}={offset}"
+        for pair in itertools.zip_longest(
+            [("x", x) for x in x_folds], [("y", y) for y in y_folds],
+        )
+        for (axis, offset) in filter(None, pair)
+    ]
+    return lines(f"{x},{y}" for (x, y) in dots) + "\n" + lines(folds)
+
+
+@generator("day14")
+def gen_day14(size: int, rng: random.Random) -> Input:
+    elements = "BCFHKNOPSV"
+    template = "".join(rng.choices(elements, k=max(size, 2)))
+    rules = [
+        f"{a}{b} -> {rng.choice(elements)}"
+        for (a, b) in itertools.product(elements, repeat=2)
+    ]
+    return template + "\n\n" + lines(rules)
+
+
+@generator("day15")
+def gen_day15(size: int, rng: random.Random) -> Input:
+    return digit_grid(max(size, 2), rng, lambda: rng.randint(1, 9))
+
+
+def bits(value: int, width: int) -> str:
+    return format(value, f"0{width}b")
+
+
+@generator("day16")
+def gen_day16(size: int, rng: random.Random) -> Input:
+    # The decoders recurse once per nesting level, so the depth is capped.
+    max_depth = 40
+
+    def literal() -> str:
+        value = rng.getrandbits(rng.randint(1, 20))
+        groups = [value >> shift & 0xF for shift in range(0, max(value.bit_length(), 1), 4)][::-1]
+        encoded = "".join(
+            ("1" if i + 1 < len(groups) else "0") + bits(group, 4)
+            for (i, group) in enumerate(groups)
+        )
+        return bits(rng.randrange(8), 3) + bits(4, 3) + encoded
+
+    def packet(budget: int, depth: int) -> str:
+        if budget <= 1 or depth >= max_depth:
+            return literal()
+        if budget >= 3 and rng.random() < 0.2:
+            type = rng.choice([5, 6, 7])
+            count = 2
+        else:
+            type = rng.choice([0, 1, 2, 3])
+            count = rng.randint(1, min(budget - 1, 8 if type != 1 else 3))
+        shares = [1] * count
+        for _ in range(budget - 1 - count):
+            shares[rng.randrange(count)] += 1
+        operands = "".join(packet(share, depth + 1) for share in shares)
+        header = bits(rng.randrange(8), 3) + bits(type, 3)
+        if len(operands) < 1 << 15 and rng.random() < 0.5:
+            return header + "0" + bits(len(operands), 15) + operands
+        return header + "1" + bits(count, 11) + operands
+
+    encoded = packet(max(size, 1), 0)
+    encoded += "0" * (-len(encoded) % 4)
+    return "".join(f"{int(encoded[i:i + 4], 2):X}" for i in range(0, len(encoded), 4)) + "\n"
+
+
+@generator("day17")
+def gen_day17(size: int, rng: random.Random) -> Input:
+    # x_min..x_max contains a triangular number, as day17a requires.
+    k = rng.randint(5, 20)
+    x_min = max(1, k * (k + 1) // 2 - rng.randint(0, k))
+    x_max = x_min + rng.randint(k, 3 * k)
+    y_min = -max(size, 10)
+    y_max = y_min + rng.randint(1, max(-y_min // 4, 1))
+    return (x_min, x_max, y_min, y_max)
+
+
+@generator("day18")
+def gen_day18(size: int, rng: random.Random) -> Input:
+    def number(depth: int):
+        if depth == 4 or (depth > 0 and rng.random() < 0.3):
+            return rng.randint(0, 9)
+        return [number(depth + 1), number(depth + 1)]
+
+    return lines(
+        str(number(0)).replace(" ", "") for _ in range(max(size, 2))
+    )
+
+
+def rotations() -> list[tuple[tuple[int, int, int], tuple[int, int, int]]]:
+    result = []
+    for (cols, signs) in itertools.product(
+        itertools.permutations(range(3)), itertools.product([-1, 1], repeat=3)
+    ):
+        inversions = sum(1 for i in range(3) for j in range(i) if cols[j] > cols[i])
+        if (-1) ** inversions * signs[0] * signs[1] * signs[2] == 1:
+            result.append((cols, signs))
+    return result
+
+
+@generator("day19")
+def gen_day19(size: int, rng: random.Random) -> Input:
+    # Every scanner overlaps a previously placed one in at least 12 beacons
+    # and reports all beacons within range in its own orientation.
+    scan_range = 1000
+
+    def within(center, low, high) -> tuple[int, int, int]:
+        return tuple(
+            rng.randint(max(c - scan_range, lo), min(c + scan_range, hi))
+            for (c, lo, hi) in zip(center, low, high)
+        )
+
+    positions = [(0, 0, 0)]
+    beacons = {within((0, 0, 0), (-scan_range,) * 3, (scan_range,) * 3) for _ in range(26)}
+    for _ in range(max(size, 2) - 1):
+        parent = rng.choice(positions)
+        offset = [rng.randint(-1200, 1200) for _ in range(3)]
+        axis = rng.randrange(3)
+        offset[axis] = rng.choice([-1, 1]) * rng.randint(1000, 1200)
+        position = tuple(p + o for (p, o) in zip(parent, offset))
+        low = tuple(max(p, q) - scan_range for (p, q) in zip(parent, position))
+        high = tuple(min(p, q) + scan_range for (p, q) in zip(parent, position))
+        beacons.update(within(position, low, high) for _ in range(12))
+        beacons.update(within(position, (-10 ** 9,) * 3, (10 ** 9,) * 3) for _ in range(12))
+        positions.append(position)
+
+    all_rotations = rotations()
+    scanners = []
+    for (id, position) in enumerate(positions):
+        (cols, signs) = all_rotations[0] if id == 0 else rng.choice(all_rotations)
+        visible = [
+            tuple(b - p for (b, p) in zip(beacon, position))
+            for beacon in beacons
+            if all(abs(b - p) <= scan_range for (b, p) in zip(beacon, position))
+        ]
+        rng.shuffle(visible)
+        rotated = [
+            ",".join(str(signs[i] * delta[cols[i]]) for i in range(3))
+            for delta in visible
+        ]
+        scanners.append(f"--- scanner {id} ---\n" + lines(rotated))
+    return "\n".join(scanners)
+
+
+@generator("day20")
+def gen_day20(size: int, rng: random.Random) -> Input:
+    algorithm = rng.choices(".#", k=512)
+    if algorithm[0] == "#":
+        algorithm[511] = "."
+    image = lines(
+        "".join(rng.choices(".#", k=max(size, 1))) for _ in range(max(size, 1))
+    )
+    return "".join(algorithm) + "\n\n" + image
+
+
+@generator("day21")
+def gen_day21(size: int, rng: random.Random) -> Input:
+    return (rng.randint(1, 10), rng.randint(1, 10))
+
+
+@generator("day22")
+def gen_day22(size: int, rng: random.Random) -> Input:
+    # As in the real inputs, only the first 20 steps touch the initialization
+    # region -50..50 and all later cuboids lie entirely outside of it.
+    def interval(low: int, high: int, length: int) -> tuple[int, int]:
+        start = rng.randint(low, high - length)
+        return (start, start + length)
+
+    steps = []
+    for index in range(max(size, 1)):
+        onoff = "on" if index == 0 or rng.random() < 0.6 else "off"
+        if index < 20:
+            ranges = [interval(-50, 50, rng.randint(0, 50)) for _ in range(3)]
+        else:
+            ranges = [interval(-100000, 100000, rng.randint(1000, 60000)) for _ in range(3)]
+            axis = rng.randrange(3)
+            ranges[axis] = interval(51, 100000, rng.randint(1000, 40000))
+            if rng.random() < 0.5:
+                ranges[axis] = (-ranges[axis][1], -ranges[axis][0])
+        coords = ",".join(
+            f"{axis}={low}..{high}" for (axis, (low, high)) in zip("xyz", ranges)
+        )
+        steps.append(f"{onoff} {coords}")
+    return lines(steps)
+
+
+def gen_amphipods(name: str, rng: random.Random, folded: list[str]) -> Input:
+    kinds = list("AABBCCDD")
+    rng.shuffle(kinds)
+    rooms = [
+        kinds[2 * i] + middle + kinds[2 * i + 1]
+        for (i, middle) in enumerate(folded)
+    ]
+    return (Day.load(name).module.State.make(rooms),)
+
+
+@generator("day23a")
+def gen_day23a(size: int, rng: random.Random) -> Input:
+    return gen_amphipods("day23a", rng, ["", "", "", ""])
+
+
+@generator("day23b")
+def gen_day23b(size: int, rng: random.Random) -> Input:
+    return gen_amphipods("day23b", rng, ["DD", "CB", "BA", "AC"])
+
+
+MONAD_BLOCK = """\
+inp w
+mul x 0
+add x z
+mod x 26
+div z {div}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y
+"""
+
+
+@generator("day24")
+def gen_day24(size: int, rng: random.Random) -> Input:
+    # Seven digits are pushed onto a base-26 stack and seven are popped and
+    # compared, so that z ends up 0 exactly for the valid model numbers.
+    pushes = 7
+    blocks = []
+    (stack, pushed) = ([], 0)
+    for index in range(2 * pushes):
+        if stack and (pushed == pushes or rng.random() < 0.5):
+            offset = stack.pop()
+            delta = rng.randint(-8, 8)
+            blocks.append(MONAD_BLOCK.format(div=26, check=delta - offset, offset=rng.randint(1, 16)))
+        else:
+            offset = rng.randint(1, 16)
+            stack.append(offset)
+            pushed += 1
+            blocks.append(MONAD_BLOCK.format(div=1, check=rng.randint(10, 16), offset=offset))
+    return "".join(blocks)
+
+
+@generator("day25")
+def gen_day25(size: int, rng: random.Random) -> Input:
+    return lines(
+        "".join(rng.choices(".>v", weights=[4, 3, 3], k=max(size, 1)))
+        for _ in range(max(size, 1))
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic puzzle input to stdout.",
+    )
+    parser.add_argument("module", help="module name, e.g. day05b")
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    input = generate(args.module, args.size, args.seed)
+    if isinstance(input, tuple):
+        sys.exit(f"{args.module} takes its input as arguments: {input}")
+    sys.stdout.write(input)
+
+
+if __name__ == "__main__":
+    main()
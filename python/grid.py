@@ -0,0 +1,51 @@
+from collections.abc import Iterator
+
+import numpy as np
+
+Grid = np.ndarray
+Offset = tuple[int, int]
+
+NEIGHBORS4: list[Offset] = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+NEIGHBORS8: list[Offset] = [
+    (di, dj) for di in [-1, 0, 1] for dj in [-1, 0, 1] if di != 0 or dj != 0
+]
+WINDOW9: list[Offset] = [(di, dj) for di in [-1, 0, 1] for dj in [-1, 0, 1]]
+
+
+def parse(data: bytes | str) -> Grid:
+    if isinstance(data, str):
+        data = data.encode()
+    data = data.replace(b"\r", b"").rstrip(b"\n") + b"\n"
+    width = data.index(b"\n")
+    cells = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)
+    if np.any(cells[:, width] != ord("\n")):
+        raise ValueError("rows of a grid must all have the same length")
+    return np.ascontiguousarray(cells[:, :width])
+
+
+def parse_digits(data: bytes | str) -> Grid:
+    return parse(data) - np.uint8(ord("0"))
+
+
+def pad(grid: Grid, fill, width: int = 1) -> Grid:
+    return np.pad(grid, width, mode="constant", constant_values=fill)
+
+
+def shifts(grid: Grid, offsets: list[Offset], fill) -> Iterator[Grid]:
+    # The view for offset (di, dj) holds grid[i + di, j + dj] at (i, j) and
+    # fill wherever that lies outside of the grid.
+    (m, n) = grid.shape
+    padded = pad(grid, fill)
+    for (di, dj) in offsets:
+        yield padded[1 + di:1 + di + m, 1 + dj:1 + dj + n]
+
+
+def wrap(grid: Grid, di: int, dj: int) -> Grid:
+    return np.roll(grid, (-di, -dj), axis=(0, 1))
+
+
+def count_neighbors(mask: Grid, offsets: list[Offset] = NEIGHBORS8) -> Grid:
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for shifted in shifts(mask, offsets, False):
+        counts += shifted
+    return counts
@@ -0,0 +1,83 @@
+from pathlib import Path
+import sys
+import tracemalloc
+from tracemalloc import get_traced_memory
+from types import FrameType
+from typing import Any, Callable
+
+
+def site(statistic: tracemalloc.Statistic) -> str:
+    frame = statistic.traceback[0]
+    return f"{Path(frame.filename).name}:{frame.lineno}"
+
+
+# A new snapshot is only taken once the traced memory has grown by this
+# factor since the last one, which bounds the number of snapshots of solvers
+# whose memory grows a little at a time. The reported snapshot can thus fall
+# short of the peak by up to this factor.
+GROWTH = 1.1
+
+
+class Sampler:
+    snapshot: tracemalloc.Snapshot | None
+    size: int
+    # Traced memory beyond which the next snapshot is taken.
+    limit: int
+
+    def __init__(self):
+        self.snapshot = None
+        self.size = 0
+        self.limit = 0
+
+    def sample(self, frame: FrameType, event: str, arg: Any) -> None:
+        # Memory is checked whenever a Python function returns, which is when
+        # the blocks it built are still referenced by its caller. Returns
+        # from C functions are too frequent to be worth checking.
+        if event == "return" and (current := get_traced_memory()[0]) > self.limit:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+            self.limit = int(current * GROWTH)
+
+
+def peak(solve: Callable[[], Any]) -> int:
+    # Only the peak, without the cost of sampling sites.
+    tracemalloc.start()
+    try:
+        solve()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def profile(solve: Callable[[], Any], top: int = 10) -> dict[str, Any]:
+    # tracemalloc only sees the blocks alive when a snapshot is taken, so the
+    # solver runs under a profile hook that snapshots at its high-water mark.
+    sampler = Sampler()
+    profiler = sys.getprofile()
+    tracemalloc.start()
+    try:
+        sys.setprofile(sampler.sample)
+        try:
+            result = solve()
+        finally:
+            sys.setprofile(profiler)
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    snapshot = sampler.snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    statistics = snapshot.statistics("lineno")
+    return {
+        "peak_bytes": peak,
+        "sampled_bytes": sampler.size,
+        "blocks": sum(statistic.count for statistic in statistics),
+        "top": [
+            {"site": site(statistic), "bytes": statistic.size, "blocks": statistic.count}
+            for statistic in statistics[:top]
+        ],
+    }
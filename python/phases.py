@@ -0,0 +1,46 @@
+import atexit
+from collections import defaultdict
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import ContextManager, Iterator
+
+# Set AOC_PHASES=1 to time the phases marked in the days. When it is unset,
+# `phase` hands out one shared do-nothing context manager.
+ENABLED = os.environ.get("AOC_PHASES", "") not in ["", "0"]
+
+DISABLED = contextlib.nullcontext()
+
+TIMINGS: dict[str, float] = defaultdict(float)
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TIMINGS[name] += time.perf_counter() - start
+
+
+def phase(name: str) -> ContextManager[None]:
+    if not ENABLED:
+        return DISABLED
+    return timed(name)
+
+
+def take() -> dict[str, float]:
+    timings = dict(TIMINGS)
+    TIMINGS.clear()
+    return timings
+
+
+def report() -> None:
+    if TIMINGS:
+        print(json.dumps({"phases": take()}), file=sys.stderr)
+
+
+if ENABLED:
+    atexit.register(report)
@@ -0,0 +1,131 @@
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from heapq import heappop, heappush
+import math
+
+from selftest import selftest
+
+Node = Hashable
+Neighbors = Callable[[Node], Iterable[tuple[Node, int]]]
+Graph = Mapping[Node, Iterable[tuple[Node, int]]]
+Heuristic = Callable[[Node], int]
+
+
+@dataclass
+class Stats:
+    expanded: int = 0
+    pushed: int = 0
+
+
+def neighbors_of(graph: Graph | Neighbors) -> Neighbors:
+    if isinstance(graph, Mapping):
+        return lambda node: graph.get(node, ())
+    return graph
+
+
+def astar(
+    source: Node,
+    graph: Graph | Neighbors,
+    target: Node,
+    heuristic: Heuristic,
+    stats: Stats | None = None,
+) -> int:
+    # The heuristic must be consistent, i.e. never drop by more than the
+    # length of an edge, for the first visit of the target to be optimal.
+    neighbors = neighbors_of(graph)
+    stats = Stats() if stats is None else stats
+    distances = {source: 0}
+    # The push counter breaks ties, so nodes never need to be comparable.
+    queue = [(heuristic(source), 0, source)]
+    stats.pushed += 1
+
+    while len(queue) > 0:
+        (_, _, node) = heappop(queue)
+        node_dist = distances[node]
+        if node_dist < 0:
+            continue
+        if node == target:
+            stats.expanded += 1
+            return node_dist
+        distances[node] = -1 - node_dist
+        stats.expanded += 1
+
+        for (neighbor, edge_dist) in neighbors(node):
+            neighbor_dist = node_dist + edge_dist
+            old_dist = distances.get(neighbor)
+            if old_dist is None or 0 <= neighbor_dist < old_dist:
+                distances[neighbor] = neighbor_dist
+                heappush(queue, (neighbor_dist + heuristic(neighbor), stats.pushed, neighbor))
+                stats.pushed += 1
+
+    return math.inf
+
+
+def dijkstra(
+    source: Node,
+    graph: Graph | Neighbors,
+    target: Node,
+    stats: Stats | None = None,
+) -> int:
+    return astar(source, graph, target, lambda _: 0, stats)
+
+
+def bucket_dijkstra(
+    source: Node,
+    graph: Graph | Neighbors,
+    target: Node,
+    max_weight: int,
+    stats: Stats | None = None,
+) -> int:
+    # Dial's algorithm: for edge lengths in 0..max_weight, all tentative
+    # distances lie within max_weight of the current one, so a ring of
+    # max_weight + 1 buckets replaces the heap.
+    neighbors = neighbors_of(graph)
+    stats = Stats() if stats is None else stats
+    size = max_weight + 1
+    buckets: list[list[Node]] = [[] for _ in range(size)]
+    distances = {source: 0}
+    buckets[0].append(source)
+    stats.pushed += 1
+    pending = 1
+    current = 0
+
+    while pending > 0:
+        bucket = buckets[current % size]
+        while len(bucket) > 0:
+            node = bucket.pop()
+            pending -= 1
+            if distances[node] != current:
+                continue
+            stats.expanded += 1
+            if node == target:
+                return current
+            for (neighbor, edge_dist) in neighbors(node):
+                if not 0 <= edge_dist <= max_weight:
+                    raise ValueError(f"edge length {edge_dist} is not in 0..{max_weight}")
+                neighbor_dist = current + edge_dist
+                if neighbor not in distances or neighbor_dist < distances[neighbor]:
+                    distances[neighbor] = neighbor_dist
+                    buckets[neighbor_dist % size].append(neighbor)
+                    stats.pushed += 1
+                    pending += 1
+        current += 1
+
+    return math.inf
+
+
+@selftest
+def test_search():
+    graph = {
+        "a": [("b", 7), ("c", 2)],
+        "b": [("d", 1)],
+        "c": [("b", 3), ("d", 8)],
+        "d": [],
+    }
+    stats = Stats()
+    assert dijkstra("a", graph, "d", stats) == 6
+    assert stats == Stats(expanded=4, pushed=6)
+    assert astar("a", graph, "d", {"a": 6, "b": 1, "c": 4, "d": 0}.get) == 6
+    assert bucket_dijkstra("a", graph, "d", max_weight=8) == 6
+    assert dijkstra("d", graph, "a") == math.inf
+    assert bucket_dijkstra(0, lambda n: [(n + 1, 0), (n + 2, 1)], 7, max_weight=1) == 0
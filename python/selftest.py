@@ -0,0 +1,11 @@
+from collections import defaultdict
+from collections.abc import Callable
+
+Test = Callable[[], None]
+
+REGISTRY: dict[str, list[Test]] = defaultdict(list)
+
+
+def selftest(test: Test) -> Test:
+    REGISTRY[test.__module__].append(test)
+    return test
@@ -0,0 +1,29 @@
+import argparse
+from pathlib import Path
+
+from cache import DEFAULT_DIRECTORY, DEFAULT_MAX_BYTES, ResultCache
+from days import Day
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve a day on its real input or on a given file, reusing cached results.",
+    )
+    parser.add_argument("module", help="module name, e.g. day19a")
+    parser.add_argument("--input", type=Path, help="solve this file instead of the real input")
+    parser.add_argument("--no-cache", action="store_true", help="always solve and leave the cache untouched")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_DIRECTORY)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES, help="maximum cache size in bytes")
+    args = parser.parse_args()
+
+    day = Day.load(args.module)
+    input = day.read_input() if args.input is None else args.input.read_text()
+    if args.no_cache:
+        result = day.solve(input)
+    else:
+        result = ResultCache(args.cache_dir, args.cache_size).solve(day, input)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()